@@ -7,92 +7,358 @@
 
 """
 
-from copy import deepcopy
-from typing import OrderedDict, Any
+from typing import Any
+from weakref import WeakKeyDictionary
 
+import numpy as np
 import pandas as pd
+from scipy import stats
 
 
-def pred(results: OrderedDict[str, Any], x_values: list, ci: int = 95) -> tuple[float, float] | None:
+# Minimum number of rows before pred() spreads work across workers; below
+# this, dispatch overhead costs more than the prediction itself.
+PARALLEL_THRESHOLD: int = 512
+
+# Column names of the DataFrame returned by predict_intervals(); the same
+# quantities as statsmodels' summary_frame(). The Index is built once and
+# shared by every call to pred().
+RENAMED_COLUMNS: pd.Index = pd.Index(["mean", "mean_se", "lower ci", "upper ci", "lower pi", "upper pi"])
+
+# Arrays that pred_fast() derives from a fitted model, cached per model object
+# (results["model_results"]) rather than in the results dictionary itself. An
+# entry goes away with its model, and replacing the model in {results} makes
+# the next call derive the arrays afresh.
+_MODEL_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+# Explanation of prediction and confidence intervals printed by
+# explain_intervals().
+_PI_CI_EXPLANATION: str = "\nPrediction Interval (PI): This interval estimates the range within which a single new observation of the dependent variable (y) for a given value of the independent variable (X) is likely to fall. It is always wider than the confidence interval because it takes into account not only the error in estimating the true regression line (as the CI does) but also the variability around the line of individual points.\n\nConfidence Interval (CI): This interval estimates the range within which the mean of the dependent variable (y) for a given value of the independent variable (X) is likely to fall. It reflects the uncertainty around the estimated regression line itself. In other words, if you were to repeat the study multiple times, the CI would contain the true mean value of y for that X value in a certain percentage of the studies."
+
+
+def pred(results: dict[str, Any], x_values: list, ci: int = 95, n_jobs: int = 1) -> pd.DataFrame:
     """
     Given value(s) for the X variable(s) included in the model, print the
-    predicted y value and a 95% confidence interval.
+    predicted y value and a 95% confidence interval. x_values can be a single
+    set of X values or a list of such sets; all sets are predicted in a single
+    call to statsmodels.
+
+    pred() is predict_intervals() followed by explain_intervals(). Use
+    predict_intervals() alone to get the intervals without printing anything.
 
     Parameters
     ----------
-    results : OrderedDict  -- all data from multiple_regr()
+    results : dict  -- all data from multiple_regr()
     x_values : list -- list of x values to use for prediction, one element for
-                       each X variable
+                       each X variable, or a list of such lists
     ci : int, optional -- confidence interval, by default 95
+    n_jobs : int, optional -- number of workers to use for large batches of
+                              X values (requires joblib), by default 1
 
     Returns
     -------
-    tuple[float, float] -- lower and upper limits of the prediction interval,
-                           in that order
+    pd.DataFrame -- lower and upper limits of the prediction interval, one row
+                    for each set of X values
+
+    Raises
+    ------
+    ValueError -- if any set of X values does not have one value for each X
+                  variable in the model
 
     Example usage
     --------
     pred(results, [42], ci=95)
+    pred(results, [[42], [43], [44]], ci=95)
     """
 
-    # FEATURE: Add ability to submit a 2D list, where each list inside the outer list is a set of X values. This would output data for several data points at once, perhaps as a DataFrame of data. Maybe predict() does this already???
+    pred_df: pd.DataFrame = predict_intervals(results, x_values, ci, n_jobs)
+    explain_intervals(pred_df, results, x_values)
+
+    return pred_df[['lower pi', 'upper pi']]
+
+
+def predict_intervals(results: dict[str, Any], x_values: list, ci: int = 95, n_jobs: int = 1) -> pd.DataFrame:
+    """
+    Compute the predicted y value, confidence interval, and prediction interval
+    for one or more sets of X values. Nothing is printed.
+
+    Parameters
+    ----------
+    results : dict  -- all data from multiple_regr()
+    x_values : list -- list of x values to use for prediction, one element for
+                       each X variable, or a list of such lists
+    ci : int, optional -- confidence interval, by default 95
+    n_jobs : int, optional -- number of workers to use for large batches of
+                              X values (requires joblib), by default 1
+
+    Returns
+    -------
+    pd.DataFrame -- columns "mean", "mean_se", "lower ci", "upper ci",
+                    "lower pi", "upper pi"; one row for each set of X values
+
+    Raises
+    ------
+    ValueError -- if any set of X values does not have one value for each X
+                  variable in the model
+
+    Example usage
+    --------
+    predict_intervals(results, [[42], [43], [44]], ci=95)
+    """
 
     # fmt: off
     alpha: float = round(1 - (ci / 100), 2)
 
-    # Get a list of the X variable names used in this model.
+    # Bind the values used below to locals once, rather than looking them up
+    # in {results} every time they are needed.
+    model_results = results["model_results"]
     x_variables: list[str] = results["x_variable_names"]
 
     # If the user has submitted one set of X values, put that list in a list.
-    # The for... loop assumes it will get a list of lists.
-    if not isinstance(x_values[0], list):
-        x_values = [x_values]
+    # The rest of the function assumes it will get a list of lists. x_values
+    # is only read, never modified, so no copy is needed.
+    x_values = [x_values] if not isinstance(x_values[0], list) else x_values
+
+    # Validate every set of X values, in one pass, before doing any
+    # computation.
+    lengths: np.ndarray = np.fromiter((len(val_list) for val_list in x_values), dtype=np.int32, count=len(x_values))
+    if (lengths != len(x_variables)).any():
+        raise ValueError(f'X values submitted do not match the model parameters.\nSubmit a list (numbers inside "[ ]", separated by commas) with one value for each of:\n{x_variables}')
+
+    # Converting to a float64 array first skips pandas' dtype inference and
+    # matches the dtype of the model.
+    x_array: np.ndarray = np.asarray(x_values, dtype=np.float64)
+
+    # Get the prediction interval (used to estimate the range of possible
+    # values for a future observation... an individual response) and
+    # confidence interval (used to estimate the range of possible values
+    # for a population parameter... an average response) for all rows at once.
+    if n_jobs != 1 and len(x_array) >= PARALLEL_THRESHOLD:
+        from joblib import Parallel, delayed, effective_n_jobs
+
+        # Each row is independent, so split the rows into one contiguous
+        # chunk per worker and predict each chunk separately. Threads are used
+        # rather than processes because a formula-based statsmodels model
+        # cannot be pickled; the heavy lifting happens in NumPy, which
+        # releases the GIL.
+        chunks: list[np.ndarray] = np.array_split(x_array, effective_n_jobs(n_jobs))
+        blocks: list[np.ndarray] = Parallel(n_jobs=n_jobs, backend='threading')(
+            delayed(_predict_chunk)(model_results, chunk, x_variables, alpha) for chunk in chunks)
+        intervals: np.ndarray = np.vstack(blocks)
     else:
-        x_values = deepcopy(x_values)
+        intervals = _predict_chunk(model_results, x_array, x_variables, alpha)
 
-    for val_list in x_values:
-        if len(x_variables) != len(val_list):
-            print(f'X values submitted do not match the model parameters.\nSubmit a list (numbers inside "[ ]", separated by commas) with one value for each of:\n{x_variables}', sep="")
-            return None
+    # Build the single output DataFrame, with column names that are more
+    # understandable than statsmodels' own.
+    pred_df: pd.DataFrame = pd.DataFrame(data=intervals, columns=RENAMED_COLUMNS, copy=False)
 
-        # Create a dictionary from the submitted X values.
-        exog_dict: dict[str, float | int] = {}
-        for ndx, var in enumerate(iterable=x_variables):
-            exog_dict.update({var: val_list[ndx]})
+    return pred_df
 
-        # Create a DataFrame from the dictionary that contains one column for
-        # each X variable and the submitted X value for each variable.
-        df_new: pd.DataFrame = pd.DataFrame(data=[exog_dict])
 
-        # Get the predicted value for the given X value as a pandas Series.
-        pred_y = results['model_results'].predict(df_new)
+def explain_intervals(pred_df: pd.DataFrame, results: dict[str, Any], x_values: list, verbose: bool = True) -> None:
+    """
+    Print the predicted y value, prediction interval, and confidence interval
+    for each set of X values, as computed by predict_intervals().
 
-        # Get the prediction interval (used to estimate the range of possible
-        # values for a future observation... an individual response) and
-        # confidence interval (used to estimate the range of possible values
-        # for a population parameter... an average response).
-        pred = results['model_results'].get_prediction(exog=df_new)
+    Parameters
+    ----------
+    pred_df : pd.DataFrame -- intervals returned by predict_intervals()
+    results : dict  -- all data from multiple_regr()
+    x_values : list -- the X values passed to predict_intervals()
+    verbose : bool, optional -- if True, finish with an explanation of
+                                prediction and confidence intervals, by
+                                default True
+    """
 
-        pred_df = pred.summary_frame(alpha=alpha)
-        # Rename the columns to make them more understandable.
-        pred_df.columns = ["mean", "mean_se", "lower ci", "upper ci", "lower pi", "upper pi"]
+    # fmt: off
+    x_values = [x_values] if not isinstance(x_values[0], list) else x_values
+    x_array: np.ndarray = np.asarray(x_values, dtype=np.float64)
 
-        print("\nREGRESSION MODEL:", sep="")
-        print(f"{results['y_variable_name'][0]} ~ ", " + ".join(x_variables), "\n", sep="")
-        print(f'{" + ".join(x_variables)} --> {df_new.iloc[0, :].values}')
-        print(f'Predicted value for {results['y_variable_name'][0]}: {pred_y.iloc[0]}', sep="")
+    # The right-hand side of the model equation is the same for every row.
+    y_name: str = results["y_variable_name"]
+    equation: str = " + ".join(results["x_variable_names"])
+
+    print("\nREGRESSION MODEL:", sep="")
+    print(f"{y_name} ~ ", equation, "\n", sep="")
+
+    for ndx in range(len(pred_df)):
+        row: pd.Series = pred_df.iloc[ndx]
+
+        print(f'{equation} --> {x_array[ndx]}')
+        print(f'Predicted value for {y_name}: {row['mean']}', sep="")
 
         print('\nPrediction interval:')
-        print(f'lower {pred_df.loc[0, 'lower pi']}', sep="")
-        print(f'upper {pred_df.loc[0, 'upper pi']}', sep="")
+        print(f'lower {row['lower pi']}', sep="")
+        print(f'upper {row['upper pi']}', sep="")
 
         print('\nConfidence interval:')
-        print(f'lower {pred_df.loc[0, 'lower ci']}', sep="")
-        print(f'upper {pred_df.loc[0, 'upper ci']}', sep="")
+        print(f'lower {row['lower ci']}', sep="")
+        print(f'upper {row['upper ci']}\n', sep="")
+
+    if verbose:
+        print(_PI_CI_EXPLANATION, sep="")
+
+    return None
+
+
+def pred_fast(results: dict[str, Any], x_array: np.ndarray, ci: int = 95) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute predicted y values with prediction and confidence intervals using
+    NumPy only. The results are the same as those from predict_intervals(),
+    but no DataFrames are built and statsmodels is not called: predictions are
+    one matrix product with the parameter estimates, and the intervals are
+    computed directly from the covariance matrix of the parameter estimates
+    and the residual mean square.
+
+    Parameters
+    ----------
+    results : dict  -- all data from multiple_regr()
+    x_array : np.ndarray -- 2-D array of X values, one row for each
+                            prediction and one column for each X variable; a
+                            1-D array is reshaped to that form
+    ci : int, optional -- confidence interval, by default 95
+
+    Returns
+    -------
+    tuple[np.ndarray, ...] -- predicted values, lower pi, upper pi, lower ci,
+                              upper ci, in that order
+
+    Raises
+    ------
+    ValueError -- if x_array does not have one column for each X variable in
+                  the model
+
+    Example usage
+    --------
+    y_hat, lower_pi, upper_pi, lower_ci, upper_ci = pred_fast(results, np.array([[42], [43]]))
+    """
+
+    alpha: float = round(1 - (ci / 100), 2)
+
+    beta, cov, sigma2, df_resid = _fast_path_arrays(results)
+
+    n_x: int = len(results["x_variable_names"])
+    x_array = np.asarray(x_array, dtype=np.float64)
+    if x_array.ndim == 1:
+        x_array = x_array.reshape(-1, n_x)
+    if x_array.shape[1] != n_x:
+        raise ValueError(f'X values submitted do not match the model parameters.\nSubmit one column for each of:\n{results["x_variable_names"]}')
+
+    # Add a column of ones for the intercept, if the model has one.
+    if beta.size == n_x + 1:
+        x_design: np.ndarray = np.column_stack([np.ones(len(x_array)), x_array])
+    else:
+        x_design = x_array
+
+    y_hat: np.ndarray = x_design @ beta
+
+    # Variance of the mean response for each row: the diagonal of
+    # x_design @ cov @ x_design.T, without building the full matrix. With
+    # cov = L @ L.T, that diagonal is the squared row norms of x_design @ L:
+    # one matrix product plus a row-wise sum of squares.
+    cov_chol: np.ndarray | None = _cov_cholesky(results, cov)
+    if cov_chol is not None:
+        z: np.ndarray = x_design @ cov_chol
+        var_mean: np.ndarray = np.einsum('ij,ij->i', z, z)
+    else:
+        var_mean = np.einsum('ij,jk,ik->i', x_design, cov, x_design)
+
+    t_crit: float = stats.t.ppf(1 - alpha / 2, df_resid)
+    ci_half: np.ndarray = t_crit * np.sqrt(var_mean)
+    pi_half: np.ndarray = t_crit * np.sqrt(sigma2 + var_mean)
+
+    return y_hat, y_hat - pi_half, y_hat + pi_half, y_hat - ci_half, y_hat + ci_half
+
+
+def _fast_path_arrays(results: dict[str, Any]) -> tuple[np.ndarray, np.ndarray, float, float]:
+    """
+    Return the arrays that pred_fast() needs from the fitted model: parameter
+    estimates, their covariance matrix, the residual mean square, and the
+    residual degrees of freedom. They are extracted once per fitted model and
+    cached in _MODEL_CACHE.
+
+    Parameters
+    ----------
+    results : dict  -- all data from multiple_regr()
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, float, float] -- beta, cov, sigma2, df_resid
+    """
+
+    model_results = results["model_results"]
+    model_cache: dict[str, Any] = _MODEL_CACHE.setdefault(model_results, {})
+    if "pred_arrays" not in model_cache:
+        model_cache["pred_arrays"] = (model_results.params.to_numpy(dtype=np.float64),
+                                      model_results.cov_params().to_numpy(dtype=np.float64),
+                                      float(model_results.mse_resid),
+                                      float(model_results.df_resid))
+
+    return model_cache["pred_arrays"]
+
+
+def _cov_cholesky(results: dict[str, Any], cov: np.ndarray) -> np.ndarray | None:
+    """
+    Return the lower-triangular Cholesky factor L of the covariance matrix of
+    the parameter estimates (cov = L @ L.T). L is computed once per fitted
+    model and cached in _MODEL_CACHE. If cov is not positive definite (e.g.,
+    the X variables are collinear), None is cached and returned instead.
+
+    Parameters
+    ----------
+    results : dict  -- all data from multiple_regr()
+    cov : np.ndarray -- covariance matrix of the parameter estimates
+
+    Returns
+    -------
+    np.ndarray | None -- Cholesky factor of cov, or None
+    """
+
+    model_cache: dict[str, Any] = _MODEL_CACHE.setdefault(results["model_results"], {})
+    if "cov_chol" not in model_cache:
+        try:
+            model_cache["cov_chol"] = np.linalg.cholesky(cov)
+        except np.linalg.LinAlgError:
+            model_cache["cov_chol"] = None
+
+    return model_cache["cov_chol"]
+
+
+def _predict_chunk(model_results: Any, x_array: np.ndarray, x_variables: list[str], alpha: float) -> np.ndarray:
+    """
+    Compute predicted values, confidence intervals, and prediction intervals
+    for a block of rows of X values. This is the unit of work that pred()
+    hands to each worker when it runs in parallel.
+
+    The values are read directly from statsmodels' PredictionResults rather
+    than through summary_frame(), which would build a DataFrame only to have
+    its columns renamed.
+
+    Parameters
+    ----------
+    model_results : RegressionResultsWrapper -- statsmodels fitted model
+    x_array : np.ndarray -- 2-D array of X values, one column per X variable
+    x_variables : list[str] -- names of the X variables in the model
+    alpha : float -- significance level for the intervals
+
+    Returns
+    -------
+    np.ndarray -- one row for each row of x_array; columns in the order of
+                  RENAMED_COLUMNS
+    """
+
+    df_new: pd.DataFrame = pd.DataFrame(data=x_array, columns=x_variables, copy=False)
+
+    prediction = model_results.get_prediction(exog=df_new)
+
+    mean: np.ndarray = np.asarray(prediction.predicted_mean)
+    se_mean: np.ndarray = np.asarray(prediction.se_mean)
+    se_obs: np.ndarray = np.asarray(prediction.se_obs)
 
-        print("\nPrediction Interval (PI): This interval estimates the range within which a single new observation of the dependent variable (y) for a given value of the independent variable (X) is likely to fall. It is always wider than the confidence interval because it takes into account not only the error in estimating the true regression line (as the CI does) but also the variability around the line of individual points.\n\nConfidence Interval (CI): This interval estimates the range within which the mean of the dependent variable (y) for a given value of the independent variable (X) is likely to fall. It reflects the uncertainty around the estimated regression line itself. In other words, if you were to repeat the study multiple times, the CI would contain the true mean value of y for that X value in a certain percentage of the studies.", sep="")
+    t_crit: float = stats.t.ppf(1 - alpha / 2, prediction.df)
+    ci_half: np.ndarray = t_crit * se_mean
+    pi_half: np.ndarray = t_crit * se_obs
 
-    return pred_df.loc[0, 'lower pi'], pred_df.loc[0, 'upper pi']
+    return np.column_stack([mean, se_mean, mean - ci_half, mean + ci_half, mean - pi_half, mean + pi_half])
 
 
 if __name__ == '__main__':
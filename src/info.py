@@ -6,7 +6,10 @@
  to the user.
 """
 
-from typing import OrderedDict, Any
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 DESCRIPTIONS: dict[str, str] = {
     "model_results": "statsmodels model_results; since this variable holds the statsmodels result for model.fit(), any method from statsmodels can be applied to this variable\nExample -- results['model_results'][0].summary()",
@@ -28,15 +31,15 @@ DESCRIPTIONS: dict[str, str] = {
     "anova": "Stepwise ANOVA table",
     "anova_summary": "statsmodels' OLS Regression Results",
     "coefficients": "list of parameter coefficients",
-    "intercept": "estimate for intercept",
+    "intercept": "estimate for intercept; None if the model has no constant",
     "slope": "estimate(s) for the regression parameters",
     "SE_coefficients": "list of SE for coefficients",
-    "std_error_b0": "SE of the intercept parameter estimate",
+    "std_error_b0": "SE of the intercept parameter estimate; None if the model has no constant",
     "std_error_b1": "SE of the parameter estimates",
     "t_statistics": "t statistics for coefficients",
     "t_pvalues": "p value for each of the t statistics in multiple regression",
-    "t_intercept": "intercept / std_error_B0",
-    "t_intercept_p": "p value for intercept",
+    "t_intercept": "intercept / std_error_B0; None if the model has no constant",
+    "t_intercept_p": "p value for intercept; None if the model has no constant",
     "t_slope": "slope / std_error_B1",
     "t_slope_p": "p value for slope",
     "DFM": "degrees of freedom of the model; equals the number of parameters",
@@ -118,48 +121,123 @@ CALCULATIONS: dict[str, str] = {
 }
 
 
-def print_variables(data: OrderedDict[str, Any] = None) -> None:
+# Intern the variable names so that lookups with names from DESCRIPTIONS,
+# CALCULATIONS, and included_vars() compare by identity. Identifier-like
+# literals are interned by the compiler already, but names such as
+# "Durbin-Watson" are not.
+#
+# Both are then exposed as read-only views: they can be shared freely (e.g.,
+# across threads) and never need to be copied defensively.
+DESCRIPTIONS = MappingProxyType({sys.intern(k): v for k, v in DESCRIPTIONS.items()})
+CALCULATIONS = MappingProxyType({sys.intern(k): v for k, v in CALCULATIONS.items()})
+
+
+class VariableInfo(NamedTuple):
+    """
+    Description and calculation method of one variable in {all_stats}.
+    """
+
+    description: str
+    calculation: str
+
+
+# DESCRIPTIONS and CALCULATIONS share the same keys. INFO_TABLE pairs them so
+# that a single lookup retrieves both: {variable: VariableInfo}. Like the two
+# tables it is built from, it is read-only.
+INFO_TABLE: MappingProxyType[str, VariableInfo] = MappingProxyType({k: VariableInfo(v, CALCULATIONS[k]) for k, v in DESCRIPTIONS.items()})
+
+# Variable names with a description or calculation, for membership tests.
+_DESC_KEYS: frozenset[str] = frozenset(DESCRIPTIONS)
+_CALC_KEYS: frozenset[str] = frozenset(CALCULATIONS)
+
+# Variables that hold DataFrames; var_info() prints these as tables.
+_DATAFRAME_VARS: frozenset[str] = frozenset(("y", "X", "fitted_values", "residuals", "corr_matrix", "corr_matrix_exog", "cov_matrix"))
+
+# Arguments to calculation() and description() that ask for the variables list.
+_HELP_TOKENS: frozenset[str] = frozenset(("h", "help"))
+
+# Variables included in {all_stats}, in the order in which they appear, grouped
+# by section. See included_vars().
+# fmt: off
+_VARS_LIST: tuple[tuple[str, ...], ...] = tuple(tuple(sys.intern(var) for var in group) for group in (
+    ("model_results",),
+    ("x_variable_names", "y_variable_name", "n", "y", "X"),
+    ("sumx", "sumy", "sumxy", "sumx2", "sumy2", "x_bar", "y_bar", "SXX", "SYY", "SXY"),
+    ("anova", "anova_summary", "coefficients", "intercept", "slope", "SE_coefficients", "std_error_b0", "std_error_b1", "t_statistics", "t_pvalues", "t_intercept", "t_intercept_p", "t_slope", "t_slope_p", "DFM", "DFR", "DFT", "k"),
+    ("SS_model", "RSS", "SS_total", "MSE_total", "MSE_model", "MSE", "SEE", "r_squared", "r_squared_adj", "correlation", "F", "F_pvalue"),
+    ("Durbin-Watson", "corr_matrix", "cov_matrix", "fitted_values", "residuals"),
+    ("const",),
+))
+# fmt: on
+
+
+# Rule printed under headings.
+_DASH: str = "-" * 32
+
+# Headings printed by print_variables(), keyed by the first variable in each
+# section.
+_SECTION_HEADERS: dict[str, str] = {
+    "x_variable_names": f"\nDATA\n{_DASH}",
+    "sumx": f"\nUNDERLYING STATISTICS\n{_DASH}",
+    "anova": f"\nREGRESSION MODEL\n{_DASH}",
+    "SS_model": f"\nMODEL FIT STATISTICS\n{_DASH}",
+    "corr_matrix": f"\nADDITIONAL INFORMATION\n{_DASH}",
+}
+
+
+def print_variables(data: dict[str, Any] = None) -> None:
     """
     Print to the terminal a list of all variables exposed in the "results"
     dictionary. The list is organized with headings to make it slightly easier
     to find a particular variable.
     """
 
-    section = 0
-    for k, v in DESCRIPTIONS.items():
+    # Without data, the output never changes; it was built at import time.
+    if not data:
+        sys.stdout.write(_STATIC_TEMPLATE)
+        return None
+
+    # Collect every line of output and write it all at once.
+    parts: list[str] = []
+    for k in DESCRIPTIONS:
         # Insert headings at the appropriate places.
-        match k:
-            case 'x_variable_names':
-                if section in [0, 1]:
-                    print("\nDATA")
-                    print("-" * 32)
-            case 'sumx':
-                if section in [0, 2]:
-                    print("\nUNDERLYING STATISTICS")
-                    print("-" * 32)
-            case 'anova':
-                if section in [0, 3]:
-                    print("\nREGRESSION MODEL")
-                    print("-" * 32)
-            case 'SS_model':
-                if section in [0, 4]:
-                    print("\nMODEL FIT STATISTICS")
-                    print("-" * 32)
-            case 'corr_matrix':
-                if section in [0, 5]:
-                    print("\nADDITIONAL INFORMATION")
-                    print("-" * 32)
-
-        # Print the variable name.
-        if data:
-            print(f'{k}: {data[k]}')
-        else:
-            print(k, sep='')
+        header = _SECTION_HEADERS.get(k)
+        if header:
+            parts.append(header)
+
+        # Add the variable name and its value.
+        parts.append(f'{k}: {data[k]}')
+
+    sys.stdout.write("\n".join(parts) + "\n")
 
     return None
 
 
-def var_info(results: OrderedDict[str, Any], variable_name: str = "", all_rows: bool = False) -> None:
+def _build_template() -> str:
+    """
+    Build the output of print_variables() when no data are provided: all
+    headings and variable names. Called once, at import time.
+
+    Returns
+    -------
+    str -- the complete text to print, ending in a newline
+    """
+
+    parts: list[str] = []
+    for k in DESCRIPTIONS:
+        header = _SECTION_HEADERS.get(k)
+        if header:
+            parts.append(header)
+        parts.append(k)
+
+    return "\n".join(parts) + "\n"
+
+
+# Output of print_variables() without data.
+_STATIC_TEMPLATE: str = _build_template()
+
+
+def var_info(results: dict[str, Any], variable_name: str = "", all_rows: bool = False) -> None:
     """
     Print detailed information about a single variable. This includes the
     variable name, its value computed for this regression, a description, and
@@ -192,55 +270,46 @@ def var_info(results: OrderedDict[str, Any], variable_name: str = "", all_rows:
 
     result = results[variable_name]
 
-    print(f"\nRESULTS FOR {variable_name}")
-    print("-" * 32)
+    # Collect every line of output and write it all at once.
+    parts: list[str] = [f"\nRESULTS FOR {variable_name}", _DASH]
 
-    if variable_name in ['y', 'X', 'fitted_values', 'residuals', 'corr_matrix', 'corr_matrix_exog', 'cov_matrix']:
+    if variable_name in _DATAFRAME_VARS:
         if all_rows:
-            print(result.to_string(index=False, header=True, justify="left"))
+            parts.append(result.to_string(index=False, header=True, justify="left"))
         else:
-            print(result.head())
+            parts.append(str(result.head()))
     else:
         if isinstance(result, list):
             for item in result:
-                print(" " * 4, item)
+                parts.append(f"{' ' * 4} {item}")
         else:
-            print(" " * 4, result)
+            parts.append(f"{' ' * 4} {result}")
 
-    print()
-    print(f" DESCRIPTION:\n {DESCRIPTIONS[variable_name]}", sep="")
-    print()
-    print(f" CALCULATION:\n {CALCULATIONS[variable_name]}", sep="")
-    print()
+    var_info_entry: VariableInfo = INFO_TABLE[variable_name]
+
+    parts.extend(["", f" DESCRIPTION:\n {var_info_entry.description}", "", f" CALCULATION:\n {var_info_entry.calculation}", ""])
 
+    sys.stdout.write("\n".join(parts) + "\n")
 
-def included_vars() -> list[list[str]]:
+
+def included_vars() -> tuple[tuple[str, ...], ...]:
     """
     Utility function that provides a list of variables included in {all_stats}.
     This function is not meant to be accessible to the end-user, but is called
     by multiple_regr() to create an ordered list of variables in {all_stat}.
 
     CODENOTE:
-        [vars_list], below, should contain all the variables that are included
-        in {all_stats} and needs to be updated if {all_stats} is changed.
+        (_VARS_LIST), above, should contain all the variables that are
+        included in {all_stats} and needs to be updated if {all_stats} is
+        changed. It is built once, at import time, and is immutable, so the
+        same object is returned on every call.
 
     Returns
     -------
-    list[list[str]] -- variables list
+    tuple[tuple[str, ...], ...] -- variables list, grouped by section
     """
 
-    # fmt: off
-    vars_list: list[list[str]] = [
-        ["model_results"],
-        ["x_variable_names", "y_variable_name", "n", "y", "X"],
-        ["sumx", "sumy", "sumxy", "sumx2", "sumy2", "x_bar", "y_bar", "SXX", "SYY", "SXY"],
-        ["anova", "anova_summary", "coefficients", "intercept", "slope", "SE_coefficients", "std_error_b0", "std_error_b1", "t_statistics", "t_pvalues", "t_intercept", "t_intercept_p", "t_slope", "t_slope_p", "DFM", "DFR", "DFT", "k"],
-        ["SS_model", "RSS", "SS_total", "MSE_total", "MSE_model", "MSE", "SEE", "r_squared", "r_squared_adj", "correlation", "F", "F_pvalue"],
-        ["Durbin-Watson", "corr_matrix", "cov_matrix", "fitted_values", "residuals"],
-        ["const"]
-    ]
-    # fmt: on
-    return vars_list
+    return _VARS_LIST
 
 
 def calculation(var: str = "") -> None:
@@ -268,20 +337,14 @@ def calculation(var: str = "") -> None:
         print()
         return None
 
-    if var != "" and var not in CALCULATIONS.keys():
-        if var.lower() not in ["h", "help"]:
+    if var not in _CALC_KEYS:
+        if var.lower() not in _HELP_TOKENS:
             print(f'"{var}" not found in results.\n')
         print_variables()
         print()
         return None
 
-    for k, v in CALCULATIONS.items():
-        if k != "const":
-            if var:
-                if k == var:
-                    print(k, ": ", v, sep="")
-            else:
-                print(k, ": ", v, sep="")
+    sys.stdout.write(f"{var}: {CALCULATIONS[var]}\n")
 
     return None
 
@@ -312,37 +375,90 @@ def description(var: str = "") -> None:
         print()
         return None
 
-    if var != "" and var not in DESCRIPTIONS.keys():
-        if var.lower() not in ["h", "help"]:
+    if var not in _DESC_KEYS:
+        if var.lower() not in _HELP_TOKENS:
             print(f'"{var}" not found in results.\n')
         print_variables()
         print()
         return None
 
-    for k, v in DESCRIPTIONS.items():
-        if k != "const":
-            if var:
-                if k == var:
-                    print(k, ": ", v, sep="")
-                    break
-            else:
-                print(k, ": ", v, sep="")
+    sys.stdout.write(f"{var}: {DESCRIPTIONS[var]}\n")
 
     return None
 
 
-def methods() -> None:
+@lru_cache(maxsize=None)
+def definitions(name: str) -> str:
     """
-    List all exposed methods used in r_linreg module. Submodules include
-    reports, info, transform, and ancillary.
+    Return the description of a variable (its definition or meaning) as a
+    string, rather than printing it. DESCRIPTIONS is read-only, so results are
+    cached and repeated calls for the same variable are a single lookup.
+
+    Parameters
+    ----------
+    name : str -- a variable name (key in {DESCRIPTIONS})
+
+    Returns
+    -------
+    str -- description of the variable
+
+    Raises
+    ------
+    KeyError -- if name is not a known variable
+
+    Examples
+    --------
+    definitions("x_bar") --> 'mean of xi; one mean for each X column'
+    """
+
+    return DESCRIPTIONS[name]
+
+
+@lru_cache(maxsize=None)
+def calculations_of(name: str) -> str:
+    """
+    Return the method by which a variable was calculated (or obtained) as a
+    string, rather than printing it. CALCULATIONS is read-only, so results are
+    cached and repeated calls for the same variable are a single lookup.
+
+    Parameters
+    ----------
+    name : str -- a variable name (key in {CALCULATIONS})
+
+    Returns
+    -------
+    str -- calculation method for the variable
+
+    Raises
+    ------
+    KeyError -- if name is not a known variable
+
+    Examples
+    --------
+    calculations_of("x_bar") --> 'sum(xi)/n or np.mean(x)'
     """
-    txt = """
+
+    return CALCULATIONS[name]
+
+
+# Text printed by methods().
+_METHODS_TXT: str = """
 EXPOSED FUNCTIONS (by module):
 
     r_linreg:
-        linreg(x, y, const=True)
+        linreg(x, y, const=True, use_formula=False, with_anova=False,
+               dtype=np.float64)
             initial function to run linear regression analysis.
             Results are returned as a dictionary.
+            use_formula=True fits the model with statsmodels' formula
+            api instead of solving the least-squares problem directly
+            with_anova=True computes the ANOVA table and summary right
+            away; otherwise they are computed when first accessed
+            dtype=np.float32 stores and multiplies x in single precision
+            to save memory on large data; results stay float64
+        linreg_many(x, Y, const=True, with_anova=False, dtype=np.float64)
+            regress each column of Y on the same x, factoring x only
+            once. Returns {column name: results dictionary}.
 
     reports:
         anova(results)
@@ -360,8 +476,12 @@ EXPOSED FUNCTIONS (by module):
     info:
         calculation("var")
             source or method of calculation for one variable ("var")
+        calculations_of("var")
+            returns, rather than prints, the calculation for "var"
         description("var")
             description or definition for one variable ("var")
+        definitions("var")
+            returns, rather than prints, the description of "var"
         print_variables(results)
             - list all variables in regression results;
             - including results is optional; if results is provided as an
@@ -377,34 +497,45 @@ EXPOSED FUNCTIONS (by module):
             - "all_rows": False prints DataFrame head() only
 
     ancillary:
-        pred(results, X: list, ci)
+        pred(results, X: list, ci, n_jobs=1)
             print predicted y and 95 % confidence interval for
-            provided values of X variable(s)
+            provided values of X variable(s); X can also be a list of
+            lists to predict several sets of X values at once; n_jobs > 1
+            splits large batches across workers (requires joblib)
+        predict_intervals(results, X: list, ci, n_jobs=1)
+            same computation as pred(), but returns a DataFrame of
+            predicted values, confidence intervals, and prediction
+            intervals without printing anything
+        explain_intervals(pred_df, results, X: list, verbose=True)
+            print the intervals returned by predict_intervals();
+            verbose=True adds an explanation of PI and CI
+        pred_fast(results, X: np.ndarray, ci)
+            NumPy-only version of predict_intervals(); returns arrays of
+            predicted values, lower/upper pi, and lower/upper ci
 
     transform:
         dummy(df, column)
             returns DataFrame with "column" converted to dummy variables (e.g.,
-            column containing "East", "South", and "West" becomes three columns
-            with those names)
+            column containing "East", "South", and "West" gains three uint8
+            columns named "column_East", "column_South", and "column_West",
+            plus "column_nan" if "column" has missing values)
         encode(df, column)
             returns DataFrame with a binary "column" converted to a categorical
             variable (0, 1)
-        interaction(df, column1, column2)
+        interaction(df, column1, column2, dtype=None)
             returns the DataFrame with a new column that is the interaction
-            between "column1" and "column2"
-        poly(df, column, order)
+            between "column1" and "column2"; dtype=np.float32 stores the new
+            column in single precision
+        interactions_all(df, columns, dtype=None)
+            returns the DataFrame with the interaction of every pair of
+            "columns" added at once ("a*b", "a*c", "b*c", ...)
+        poly(df, column, order, dtype=None)
             create a new column that is the provided polynomial ("order")of a
-            current "column".
+            current "column"; dtype as for interaction().
 """
-    print(txt)
 
-
-def usage() -> None:
-    """
-    Provide usage help and details for this module.
-    """
-
-    txt = """
+# Text printed by usage().
+_USAGE_TXT: str = """
 
 USAGE:
 
@@ -454,7 +585,21 @@ https://www.statsmodels.org/dev/generated/statsmodels.regression.
 linear_model.RegressionResults.html
     """
 
-    print(txt)
+
+def methods() -> None:
+    """
+    List all exposed methods used in r_linreg module. Submodules include
+    reports, info, transform, and ancillary.
+    """
+    print(_METHODS_TXT)
+
+
+def usage() -> None:
+    """
+    Provide usage help and details for this module.
+    """
+
+    print(_USAGE_TXT)
 
     return None
 
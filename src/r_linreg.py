@@ -63,7 +63,7 @@ STATSMODELS:
 
 import sys
 import warnings
-from collections import OrderedDict
+from functools import cache
 from typing import Any
 
 import ancillary
@@ -73,18 +73,42 @@ import pandas as pd
 import reports
 import transform
 # from icecream import ic
-from patsy import PatsyError
-from statsmodels.formula.api import ols
-from statsmodels.stats.anova import anova_lm
-from statsmodels.stats.stattools import durbin_watson
-from statsmodels.tools import add_constant
+from scipy import stats
+from scipy.linalg import LinAlgError, cho_factor, cho_solve, lstsq
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 warnings.filterwarnings(action="ignore", module="statsmodels")
 
+# create_model() solves the normal equations by Cholesky when the design has
+# at most CHOLESKY_MAX_PARAMS columns and cond(X'X) is no more than
+# CHOLESKY_MAX_COND; otherwise it uses LAPACK's SVD-based least squares.
+CHOLESKY_MAX_PARAMS: int = 32
+CHOLESKY_MAX_COND: float = 1e10
+
+# With numba installed, create_model() fits designs of at most
+# OLS_CORE_MAX_SIZE values (n * p) with a compiled QR solve. Columns whose
+# diagonal element in R is within OLS_CORE_RANK_TOL of the largest are
+# treated as linearly dependent and the fit falls back to the SVD solver.
+OLS_CORE_MAX_SIZE: int = 20_000
+OLS_CORE_RANK_TOL: float = 1e-10
+
+# float32 carries about half the significant digits of float64, so the
+# Cholesky path accepts a correspondingly smaller condition number.
+CHOLESKY_MAX_COND_FLOAT32: float = 1e5
+
+# Types accepted for x and y by validate_data().
+_VALID_TYPES: tuple[type, ...] = (pd.Series, pd.DataFrame, list)
+_VALID_TYPE_SET: frozenset[type] = frozenset(_VALID_TYPES)
+
 print()
 
 
-def linreg(x: list | pd.Series | pd.DataFrame, y: list | pd.Series | pd.DataFrame, const=True) -> OrderedDict[str, Any]:
+def linreg(x: list | pd.Series | pd.DataFrame, y: list | pd.Series | pd.DataFrame, const=True,
+           use_formula=False, with_anova=False, dtype=np.float64) -> dict[str, Any]:
     """
     This is the entry point for the r_linreg package. linreg() first sends data
     to validate_data() to reject bad data types and contents. Then x,y are sent
@@ -101,11 +125,25 @@ def linreg(x: list | pd.Series | pd.DataFrame, y: list | pd.Series | pd.DataFram
                                             or datetime]
     const : bool, optional -- default is True; determines whether or not to
                               include a constant in the regression analysis
+    use_formula : bool, optional -- default is False; if True, fit the model
+                                    with statsmodels' formula api (patsy)
+                                    instead of solving the least-squares
+                                    problem directly
+    with_anova : bool, optional -- default is False; if True, compute the
+                                   ANOVA table and the statsmodels summary
+                                   now rather than on first access
+    dtype : np.float64 | np.float32, optional -- default is np.float64; the
+                                                 type x is stored and
+                                                 multiplied in. np.float32
+                                                 halves the memory used by
+                                                 large x at the cost of
+                                                 precision; y and all
+                                                 results stay float64
 
     Returns
     -------
-    OrderedDict[str, list | str] -- dictionary of 52 linear regression statistics
-                                    either calculated or revealed by statsmodels
+    dict[str, list | str] -- dictionary of 52 linear regression statistics
+                             either calculated or revealed by statsmodels
 
     Notes:
         - When using a python list for the x variable(s), it is best to use a
@@ -113,11 +151,32 @@ def linreg(x: list | pd.Series | pd.DataFrame, y: list | pd.Series | pd.DataFram
         have fewer problems if you convert your data to a pandas.DataFrame first.
         This will ensure that the original list was in the correct (expected)
         format.
+        - The dictionary returned is a LazyStats, a dict in which the ANOVA
+        table, the summary, the correlation and covariance matrices, the
+        per-variable sums of squares and products, and the residual and
+        fitted value DataFrames are computed the first time they are
+        accessed.
     """
 
-    # If data are not validated, the program will have exited after validate_data().
+    # If data are not valid, validate_data() raises TypeError or ValueError.
     validate_data(x, y)
 
+    dtype = _float_dtype(dtype)
+
+    # A single x variable given as a python list needs none of the cleaning
+    # below when x and y convert straight to float arrays of the same length.
+    if const and _is_flat_list(x) and _is_flat_list(y):
+        try:
+            x_arr = np.asarray(x, dtype=dtype)
+            y_arr = np.asarray(y, dtype=np.float64)
+        except (TypeError, ValueError):
+            pass
+        else:
+            if x_arr.shape == y_arr.shape and np.isfinite(x_arr).all() and np.isfinite(y_arr).all():
+                x_df = pd.DataFrame({'x_variable1': x_arr})
+                y_df = pd.DataFrame({'y': y_arr})
+                return multiple_regr(x_df, y_df, const, use_formula, with_anova)
+
     # Convert x data to pandas DataFrame.
     x = clean_x_data(x)
 
@@ -126,43 +185,199 @@ def linreg(x: list | pd.Series | pd.DataFrame, y: list | pd.Series | pd.DataFram
 
     # Final check for proper shape and contents of x and y data. If check fail,
     # the program will have exited already.
-    x, y = final_check(x, y)
+    x, y = final_check(x, y, dtype)
 
-    all_stats: OrderedDict[str, Any] = multiple_regr(x, y, const)
+    all_stats: dict[str, Any] = multiple_regr(x, y, const, use_formula, with_anova)
 
     return all_stats
     # return None
 
 
+def linreg_many(x: list | pd.Series | pd.DataFrame, Y: list | pd.DataFrame, const=True,
+                with_anova=False, dtype=np.float64) -> dict[str, dict[str, Any]]:
+    """
+    Regress each column of Y on the same x. The design matrix is factored once
+    and every set of coefficients comes from one solve against X'Y, instead
+    of refitting x for each response as repeated calls to linreg() would.
+    Each response is fitted on the rows linreg() would use for it; responses
+    with missing values in different rows are solved in separate groups.
+
+    Parameters
+    ----------
+    x : list | pd.Series | pd.DataFrame -- x variable(s), as for linreg()
+    Y : list | pd.DataFrame -- one column per response variable; a python
+                               list is treated as rows of responses
+    const : bool, optional -- default is True; determines whether or not to
+                              include a constant in the regression analysis
+    with_anova : bool, optional -- default is False; see linreg()
+    dtype : np.float64 | np.float32, optional -- default is np.float64; see
+                                                 linreg()
+
+    Returns
+    -------
+    dict[str, dict[str, Any]] -- for each column of Y, by name, the same
+                                 dictionary of statistics that linreg()
+                                 returns
+    """
+
+    dtype = _float_dtype(dtype)
+
+    # Response columns from a list are named y1, y2, ...
+    if isinstance(Y, list):
+        Y = pd.DataFrame(Y)
+        Y.columns = [f'y{i + 1}' for i in range(Y.shape[1])]
+    if not isinstance(Y, pd.DataFrame):
+        raise TypeError("Y must be a python list or a pandas DataFrame.")
+
+    # validate_data() only accepts a single y column; the first stands in for Y.
+    validate_data(x, Y.iloc[:, :1])
+    x = clean_x_data(x)
+    Y = clean_y_data(Y)
+
+    # final_check() validates each response against x and drops the rows with
+    # a missing x or y value, exactly as linreg() would for that response. x
+    # itself is only converted by the first check that keeps all of its rows.
+    checked: dict[Any, tuple[pd.DataFrame, pd.DataFrame]] = {}
+    for name in Y.columns:
+        x_rows, y_col = final_check(x, Y[[name]], dtype)
+        if x_rows.shape[0] == x.shape[0]:
+            x = x_rows
+        checked[name] = (x_rows, y_col)
+
+    # Responses that keep the same rows share one design matrix, and all of
+    # their coefficients come from one solve; with no missing values, that is
+    # every response.
+    groups: list[tuple[pd.DataFrame, list[Any]]] = []
+    for name, (x_rows, _) in checked.items():
+        for x_group, names in groups:
+            if x_rows.index.equals(x_group.index):
+                names.append(name)
+                break
+        else:
+            groups.append((x_rows, [name]))
+
+    all_results: dict[str, dict[str, Any]] = {}
+    for x_group, names in groups:
+        exog: np.ndarray = _design_matrix(x_group, const)
+        _check_observations(*exog.shape)
+        endog: np.ndarray = np.column_stack([checked[name][1].to_numpy(dtype=np.float64).ravel() for name in names])
+
+        # One factorization for the group: Cholesky when it is accurate,
+        # otherwise the SVD-based least squares, which also takes a 2-D right
+        # hand side.
+        cholesky = _ols_cholesky(exog, endog) if exog.shape[1] <= CHOLESKY_MAX_PARAMS else None
+        if cholesky is not None:
+            params, normalized_cov_params = cholesky
+            rank: int = exog.shape[1]
+        else:
+            params, _, rank, _ = _lapack(lstsq, exog, endog.astype(exog.dtype, copy=False), lapack_driver='gelsd')
+            params = params.astype(np.float64, copy=False)
+            normalized_cov_params = np.linalg.pinv((exog.T @ exog).astype(np.float64, copy=False))
+
+        for j, name in enumerate(names):
+            y_col = checked[name][1]
+            model_results = LeastSquaresResults(x_group, y_col, exog, endog[:, j], params[:, j], int(rank), const,
+                                                normalized_cov_params)
+            all_results[name] = multiple_regr(x_group, y_col, const, with_anova=with_anova,
+                                              model_results=model_results)
+
+    # The results are returned in the order of the columns of Y.
+    all_results = {name: all_results[name] for name in Y.columns}
+
+    return all_results
+
+
+def _lapack(func, *args, **kwargs):
+    """
+    Call the scipy.linalg function func without its check for NaN and
+    infinite values, which would be one more pass over every input.
+    final_check() has already rejected non-finite data.
+    """
+    return func(*args, check_finite=False, **kwargs)
+
+
+def _float_dtype(dtype: Any) -> np.dtype:
+    """
+    Return dtype as a np.dtype, raising ValueError unless it is np.float64 or
+    np.float32.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float64, np.float32):
+        raise ValueError(f"dtype must be np.float64 or np.float32, not {dtype}.")
+    return dtype
+
+
+def _is_flat_list(data: Any) -> bool:
+    """
+    Return True if data is a python list whose first item is not itself a
+    sequence.
+    """
+    return isinstance(data, list) and len(data) > 0 and not isinstance(data[0], (list, tuple, np.ndarray))
+
+
 def validate_data(x: list | pd.Series | pd.DataFrame, y: list | pd.Series | pd.DataFrame) -> None:
     """
     Validate data structures and x,y contents.
         -- x and y can't be empty
         -- x and y must be of types pandas DataFrame, pandas Series, and/or list
 
+    Errors are raised rather than exiting, so that a caller running many
+    regressions can catch them.
+
     caveat emptor:
         x can contain text, but only such text that can be converted using
         transform.encode() or transform.dummy() functions. If x contains text
         that can't be thusly converted, the program will generate an error and
         exit... possibly ungracefully.
+
+    Raises
+    ------
+    TypeError -- if x or y is not a list, pandas Series, or pandas DataFrame
+    ValueError -- if x or y is empty, or y has more than one column
     """
 
-    # Validate x and y data types as list, Series, or DataFrames
-    x_type_valid: bool = isinstance(x, (pd.Series, pd.DataFrame, list))
-    y_type_valid: bool = isinstance(y, (pd.Series, pd.DataFrame, list))
-    if not x_type_valid or not y_type_valid:
-        print("x and y must be of type list, pandas Series, or pandas DataFrame.")
-        exit()
+    # Validate x and y data types as list, Series, or DataFrames. The set
+    # lookup settles the usual case; isinstance() still admits subclasses.
+    for data in (x, y):
+        if type(data) not in _VALID_TYPE_SET and not isinstance(data, _VALID_TYPES):
+            raise TypeError("x and y must be of type list, pandas Series, or pandas DataFrame.")
 
     # x and y can't be empty.
-    if len(x) == 0 or len(y) == 0:
-        print("\nx or y contains no data.")
-        exit()
+    if _is_empty(x) or _is_empty(y):
+        raise ValueError("x or y contains no data.")
 
     # y can't be a DataFrame with more than 1 column or a list of >1 dimension.
-    if isinstance(y, pd.DataFrame) and len(y.columns) > 1:
-        print("\ny must be a 1-dimensional list or pandas Series.")
-        exit()
+    if isinstance(y, pd.DataFrame) and y.shape[1] > 1:
+        raise ValueError("y must be a 1-dimensional list or pandas Series.")
+
+
+def _is_empty(data: list | pd.Series | pd.DataFrame) -> bool:
+    """
+    Return True if data holds no values.
+    """
+    return data.empty if isinstance(data, (pd.Series, pd.DataFrame)) else not data
+
+
+def _maybe_reset(data: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
+    """
+    Return data with its index reset to 0, 1, 2, ... If the index is already
+    that, data is returned as is rather than copied.
+    """
+    index = data.index
+    if isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1:
+        return data
+    return data.reset_index(drop=True)
+
+
+def _numeric_array(data: list) -> np.ndarray | None:
+    """
+    Return data as a float64 array, or None if it can't be converted (text,
+    dates, or rows of unequal length).
+    """
+    try:
+        return np.asarray(data, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
 
 
 def clean_x_data(_x: list | pd.Series | pd.DataFrame) -> pd.DataFrame:
@@ -186,28 +401,35 @@ def clean_x_data(_x: list | pd.Series | pd.DataFrame) -> pd.DataFrame:
     """
 
     # If x is a DataFrame, we don't need to do anything besides reset the index
-    # to integers starting at -0-. drop=True prevents the current index from
-    # being added as a column.
+    # to integers starting at -0-, and only then if it isn't already.
+    # drop=True prevents the current index from being added as a column.
     if isinstance(_x, pd.DataFrame):
-        x = _x.reset_index(drop=True)
+        x = _maybe_reset(_x)
 
     #  If x is a pd.Series, convert the Series to a DataFrame and reset the index.
     elif isinstance(_x, pd.Series):
-        x: pd.DataFrame = pd.DataFrame(_x)
-        x: pd.DataFrame = x.reset_index(drop=True)
+        x: pd.DataFrame = _maybe_reset(_x).to_frame()
 
     # If x is a python list, convert to a pandas.DataFrame.
     elif isinstance(_x, list):
 
-        # Convert a python n-dimension list to a DataFrame.
-        x: pd.DataFrame = pd.DataFrame(_x)
+        # A list of numbers (or numeric strings) goes through NumPy, which
+        # skips pandas' per-column type inference. Anything else, such as
+        # date strings, is left for pandas to convert.
+        arr = _numeric_array(_x)
+        if arr is not None and arr.ndim <= 2 and arr.size > 0:
+            arr = arr.reshape(arr.shape[0], -1)
+            x: pd.DataFrame = pd.DataFrame(arr, columns=[f'x_variable{i + 1}' for i in range(arr.shape[1])],
+                                           copy=False)
+
+        else:
+            # Convert a python n-dimension list to a DataFrame.
+            x: pd.DataFrame = pd.DataFrame(_x)
 
-        # Column names in a DataFrame made from a [list] are ints. These are
-        # converted to more human-readable strings in the form of x_variable1,
-        # x_variable2...
-        for old_label in range(len(list(x.columns))):
-            new_label: str = f'x_variable{old_label + 1}'
-            x: pd.DataFrame = x.rename(columns={old_label: new_label})
+            # Column names in a DataFrame made from a [list] are ints. These are
+            # converted to more human-readable strings in the form of x_variable1,
+            # x_variable2...
+            x.columns = [f'x_variable{i + 1}' for i in range(x.shape[1])]
 
     return x
 
@@ -234,30 +456,58 @@ def clean_y_data(_y: list | pd.Series | pd.DataFrame) -> pd.DataFrame:
     """
 
     # If y is a DataFrame, we don't need to do anything besides reset the index
-    # to integers starting at -0-. drop=True prevents the current index from
-    # being added as a column.
+    # to integers starting at -0-, and only then if it isn't already.
+    # drop=True prevents the current index from being added as a column.
     if isinstance(_y, pd.DataFrame):
-        y = _y.reset_index(drop=True)
+        y = _maybe_reset(_y)
 
     #  If y is a pd.Series, convert the Series to a DataFrame and reset the index.
     elif isinstance(_y, pd.Series):
-        y: pd.DataFrame = pd.DataFrame(_y)
-        y: pd.DataFrame = y.reset_index(drop=True)
+        y: pd.DataFrame = _maybe_reset(_y).to_frame()
 
     # If x is a python list, convert to a pandas.DataFrame.
     elif isinstance(_y, list):
 
-        # Convert y as a 1-dimension list to a DataFrame.
-        y: pd.DataFrame = pd.DataFrame(_y)
+        # As in clean_x_data(), a list of numbers goes through NumPy.
+        arr = _numeric_array(_y)
+        if arr is not None and arr.ndim == 1:
+            y: pd.DataFrame = pd.DataFrame({'y': arr}, copy=False)
 
-        # Column names in a DataFrame made from a [list] are ints. Change the
-        # column name to a generic "y"
-        y: pd.DataFrame = y.rename(columns={0: 'y'})
+        else:
+            # Convert y as a 1-dimension list to a DataFrame.
+            y: pd.DataFrame = pd.DataFrame(_y)
+
+            # Column names in a DataFrame made from a [list] are ints. Change the
+            # column name to a generic "y"
+            y: pd.DataFrame = y.rename(columns={0: 'y'})
 
     return y
 
 
-def final_check(x: pd.DataFrame, y: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+def _as_dtype(df: pd.DataFrame, dtype: np.dtype) -> pd.DataFrame:
+    """
+    Convert the columns of df that are not of type dtype to dtype.
+
+    Parameters
+    ----------
+    df : pd.DataFrame -- x or y data
+    dtype : np.dtype -- np.float64 or np.float32
+
+    Returns
+    -------
+    pd.DataFrame -- df itself if every column is already of type dtype
+
+    Raises
+    ------
+    ValueError -- if a column contains strings that are not numbers
+    """
+
+    flagged: dict[Any, np.dtype] = {col: dtype for col, col_dtype in df.dtypes.items() if col_dtype != dtype}
+
+    return df.astype(flagged) if flagged else df
+
+
+def final_check(x: pd.DataFrame, y: pd.DataFrame, dtype: np.dtype = np.float64) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     At this point, we should have two DataFrames, one for the x variable(s) and
     one for the y variable. We need to do some error checking.
@@ -265,29 +515,38 @@ def final_check(x: pd.DataFrame, y: pd.DataFrame) -> tuple[pd.DataFrame, pd.Data
                     If not, attempt conversion from strings to numbers.
             (2) Does y have only one column?
             (3) Are x and y the same length?
+            (4) Are there missing or infinite values?
+                    Rows with a missing (NaN) value in x or y are dropped, as
+                    the formula model does; infinite values are an error.
 
     Parameters:
     -------
         x : pd.DataFrame - Input DataFrames for x values.
         y : pd.DataFrame - Input DataFrames for y values.
+        dtype : np.dtype - Type for the x values; y is always np.float64.
 
     Returns:
     -------
         tuple[pd.DataFrame, pd.DataFrame] - The processed x and y data frames.
+
+    Raises:
+    -------
+        ValueError - If x or y contains infinite values.
     """
 
     # (1) Are the columns of data in x and y either float or int or can they be
     # converted to float or int? Note that columns with numeric strings can be
-    # converted to floats.
+    # converted to floats. Only columns that are not already of the right type
+    # are converted, so clean data are not copied.
     try:
-        # If x contains > 1 column, all columns will be converted to float64.
-        x: pd.DataFrame = x.astype(dtype=np.float64)
+        # If x contains > 1 column, all columns will be converted to dtype.
+        x: pd.DataFrame = _as_dtype(x, dtype)
     except ValueError:
         print('Could not convert string in "x" to float.')
         sys.exit()
 
     try:
-        y: pd.DataFrame = y.astype(dtype=np.float64)
+        y: pd.DataFrame = _as_dtype(y, np.float64)
     except ValueError:
         print('Could not convert string in "y" DataFrame to float.')
         sys.exit()
@@ -309,33 +568,335 @@ def final_check(x: pd.DataFrame, y: pd.DataFrame) -> tuple[pd.DataFrame, pd.Data
         print("x and y do not have equal numbers of items.")
         sys.exit()
 
+    # (4) Are there missing or infinite values? This is the only check made:
+    # the least squares routines are called without their own finite checks.
+    # The sum of the values is finite unless one of them is not, so the clean
+    # case costs one reduction over the arrays converted above, and the rows
+    # are only examined when the sum is not finite.
+    x_values: np.ndarray = x.to_numpy()
+    y_values: np.ndarray = y.to_numpy()
+    if not (np.isfinite(x_values.sum()) and np.isfinite(y_values.sum())):
+        if np.isinf(x_values).any() or np.isinf(y_values).any():
+            raise ValueError("x and y cannot contain infinite values.")
+
+        # Listwise deletion: drop every row with a missing x or y value.
+        complete: np.ndarray = ~(np.isnan(x_values).any(axis=1) | np.isnan(y_values[:, 0]))
+        if not complete.all():
+            x, y = x[complete], y[complete]
+
     return x, y
 
 
-def create_model(x_data: pd.DataFrame, y_data: pd.DataFrame, include_constant: bool):
+def create_model(x_data: pd.DataFrame, y_data: pd.DataFrame, include_constant: bool, use_formula: bool = False):
     """
-    Create the statsmodel model for x_data and y_data.
+    Fit an ordinary least squares model of y_data on x_data. By default the
+    coefficients come straight from LAPACK's least-squares solver (gelsd, an
+    SVD-based driver), which avoids building and parsing a patsy formula for
+    data that are already numeric. use_formula=True restores the original
+    statsmodels formula model.
 
     Parameters
     ----------
     x_data : pd.DataFrame -- 1 or more x variables
     y_data : pd.DataFrame -- the y variable
     include_constant : bool -- True if a constant should be included
+    use_formula : bool, optional -- default is False; if True, fit the model
+                                    with statsmodels' formula api (patsy)
 
     Returns
     -------
-    RegressionResultsWrapper -- statsmodels fitted model
+    LeastSquaresResults | RegressionResultsWrapper -- fitted model
+
+    Raises
+    ------
+    ValueError -- if there are fewer observations than parameters
+    """
+
+    _check_observations(x_data.shape[0], x_data.shape[1] + int(include_constant))
+
+    if use_formula:
+        return _fit_formula(x_data, y_data, include_constant)
+
+    exog: np.ndarray = _design_matrix(x_data, include_constant)
+    endog: np.ndarray = y_data.to_numpy(dtype=np.float64).ravel()
+
+    # One x variable and a constant: a single pass over x and y gives the
+    # slope and intercept.
+    if include_constant and exog.shape[1] == 2:
+        simple = _simple_ols_fit(exog[:, 1], endog)
+        if simple is not None:
+            params, normalized_cov_params = simple
+            return LeastSquaresResults(x_data, y_data, exog, endog, params, 2, include_constant,
+                                       normalized_cov_params)
+
+    # Small problems are dominated by per-call overhead rather than by the
+    # arithmetic, so a compiled QR solve is used when numba is available. The
+    # compiled QR is only safe with more observations than parameters; any
+    # other design, or a LinAlgError, is left to the LAPACK solvers below.
+    if (_ols_core is not None and exog.dtype == np.float64 and exog.size <= OLS_CORE_MAX_SIZE
+            and exog.shape[0] > exog.shape[1]):
+        try:
+            params, normalized_cov_params, full_rank = _ols_core(exog, endog)
+        except LinAlgError:
+            full_rank = False
+        if full_rank:
+            return LeastSquaresResults(x_data, y_data, exog, endog, params, exog.shape[1], include_constant,
+                                       normalized_cov_params)
+
+    # For a few well-conditioned x variables, the normal equations are solved
+    # faster by Cholesky than by an SVD of X.
+    cholesky = _ols_cholesky(exog, endog) if exog.shape[1] <= CHOLESKY_MAX_PARAMS else None
+    if cholesky is not None:
+        params, normalized_cov_params = cholesky
+        return LeastSquaresResults(x_data, y_data, exog, endog, params, exog.shape[1], include_constant,
+                                   normalized_cov_params)
+
+    # exog and endog are used again by LeastSquaresResults, so lstsq() may not
+    # overwrite them.
+    params, _, rank, _ = _lapack(lstsq, exog, endog.astype(exog.dtype, copy=False), lapack_driver='gelsd')
+    params = params.astype(np.float64, copy=False)
+
+    return LeastSquaresResults(x_data, y_data, exog, endog, params, int(rank), include_constant)
+
+
+def _check_observations(n_obs: int, n_params: int) -> None:
+    """
+    Reject a model with more parameters than observations, which least
+    squares cannot estimate.
+
+    Parameters
+    ----------
+    n_obs : int -- number of observations
+    n_params : int -- number of parameters, including the constant
+
+    Raises
+    ------
+    ValueError -- if n_obs is less than n_params
+    """
+
+    if n_obs < n_params:
+        raise ValueError(f"{n_params} parameters cannot be estimated from {n_obs} observations.")
+
+    return None
+
+
+def _simple_ols_loop(x: np.ndarray, y: np.ndarray) -> tuple[float, float, float, float]:
+    """
+    Simple linear regression of y on x in one pass, using Welford's updates
+    for the means and the centered sums so that large means do not cost
+    precision.
+
+    Parameters
+    ----------
+    x : np.ndarray -- x values
+    y : np.ndarray -- y values
+
+    Returns
+    -------
+    tuple[float, float, float, float] -- intercept, slope, x_bar, and SXX
+    """
+
+    x_bar = 0.0
+    y_bar = 0.0
+    sxx = 0.0
+    sxy = 0.0
+    for i in range(x.shape[0]):
+        dx = x[i] - x_bar
+        x_bar += dx / (i + 1)
+        y_bar += (y[i] - y_bar) / (i + 1)
+        sxx += dx * (x[i] - x_bar)
+        sxy += dx * (y[i] - y_bar)
+
+    b1 = sxy / sxx if sxx > 0.0 else np.nan
+    b0 = y_bar - b1 * x_bar
+
+    return b0, b1, x_bar, sxx
+
+
+def _simple_ols_numpy(x: np.ndarray, y: np.ndarray) -> tuple[float, float, float, float]:
+    """
+    Same as _simple_ols_loop(), in vectorized NumPy for when numba is not
+    installed.
+    """
+
+    x_bar = x.mean(dtype=np.float64)
+    y_bar = y.mean()
+    xc = x - x_bar
+    sxx = xc @ xc
+    b1 = (xc @ (y - y_bar)) / sxx if sxx > 0.0 else np.nan
+    b0 = y_bar - b1 * x_bar
+
+    return b0, b1, x_bar, sxx
+
+
+# The loop is only worth running when numba can compile it.
+_simple_ols = njit(cache=True)(_simple_ols_loop) if njit is not None else _simple_ols_numpy
+
+
+def _simple_ols_fit(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Fit y = b0 + b1 * x.
+
+    Parameters
+    ----------
+    x : np.ndarray -- x values
+    y : np.ndarray -- y values
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray] | None -- parameter estimates and (X'X)^-1,
+                                            or None if x is constant
+    """
+
+    b0, b1, x_bar, sxx = _simple_ols(x, y)
+    if not sxx > 0.0:
+        return None
+
+    # (X'X)^-1 for X = [1, x], written in terms of x_bar and SXX.
+    n = x.shape[0]
+    normalized_cov_params = np.array([[1.0 / n + x_bar * x_bar / sxx, -x_bar / sxx],
+                                      [-x_bar / sxx, 1.0 / sxx]])
+
+    return np.array([b0, b1]), normalized_cov_params
+
+
+def _ols_qr(exog: np.ndarray, endog: np.ndarray) -> tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Least squares by the QR decomposition X = QR: b solves Rb = Q'y and
+    (X'X)^-1 = R^-1 (R^-1)'. Written with the subset of NumPy that numba
+    compiles.
+
+    Parameters
+    ----------
+    exog : np.ndarray -- design matrix, including the constant if there is one
+    endog : np.ndarray -- y values as a 1-dimension array
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, bool] -- parameter estimates, (X'X)^-1, and
+                                           False (with zeros for the arrays)
+                                           if X is not of full column rank
+    """
+
+    k = exog.shape[1]
+    q, r = np.linalg.qr(exog)
+
+    # A (relatively) zero diagonal element of R means X is rank deficient.
+    diag = np.abs(np.diag(r))
+    if diag.min() <= diag.max() * OLS_CORE_RANK_TOL:
+        return np.zeros(k), np.zeros((k, k)), False
+
+    params = np.linalg.solve(r, np.ascontiguousarray(q.T) @ endog)
+    r_inv = np.linalg.inv(r)
+
+    return params, r_inv @ np.ascontiguousarray(r_inv.T), True
+
+
+# Only worth calling when numba can compile it; the Cholesky and SVD paths
+# are already LAPACK calls.
+_ols_core = njit(cache=True)(_ols_qr) if njit is not None else None
+
+
+def _ols_cholesky(exog: np.ndarray, endog: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Solve the normal equations (X'X)b = X'y with a Cholesky factorization.
+
+    Parameters
+    ----------
+    exog : np.ndarray -- design matrix, including the constant if there is one
+    endog : np.ndarray -- y values as a 1-dimension array, or as one column
+                          per response variable
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray] | None -- parameter estimates and (X'X)^-1,
+                                            or None if X'X is too poorly
+                                            conditioned for the normal
+                                            equations to be accurate
+    """
+
+    # The products over all n rows are done in the type of exog; the small
+    # p x p system is solved in float64.
+    xtx: np.ndarray = (exog.T @ exog).astype(np.float64, copy=False)
+    xty: np.ndarray = (exog.T @ endog.astype(exog.dtype, copy=False)).astype(np.float64, copy=False)
+
+    # Forming X'X squares the condition number of X; beyond this point the
+    # SVD-based solver is the accurate choice.
+    max_cond: float = CHOLESKY_MAX_COND if exog.dtype == np.float64 else CHOLESKY_MAX_COND_FLOAT32
+    if np.linalg.cond(xtx) > max_cond:
+        return None
+
+    try:
+        factor = _lapack(cho_factor, xtx, lower=True, overwrite_a=True)
+    except LinAlgError:
+        return None
+
+    # xtx, xty and the identity are temporaries, so LAPACK may work in place.
+    params: np.ndarray = _lapack(cho_solve, factor, xty, overwrite_b=True)
+    normalized_cov_params: np.ndarray = _lapack(cho_solve, factor, np.eye(xtx.shape[0]), overwrite_b=True)
+
+    return params, normalized_cov_params
+
+
+def _design_matrix(x_data: pd.DataFrame, include_constant: bool) -> np.ndarray:
+    """
+    Build the design matrix for x_data.
+
+    The design matrix is column-major, which is what LAPACK works on, so
+    lstsq() has nothing further to convert. It keeps the type of x_data:
+    float32 only if every x column is float32 (see linreg(dtype=...)).
+
+    Parameters
+    ----------
+    x_data : pd.DataFrame -- 1 or more x variables
+    include_constant : bool -- True if a column of ones should come first
+
+    Returns
+    -------
+    np.ndarray -- n x p design matrix
     """
 
-    # Add a constant column to x_data if include_constant == True.
+    dtype = np.float32 if (x_data.dtypes == np.float32).all() else np.float64
+
+    # With a constant, the column of ones and x_data are written straight into
+    # one buffer.
     if include_constant:
-        x_data = add_constant(data=x_data)
+        exog: np.ndarray = np.empty((x_data.shape[0], x_data.shape[1] + 1), dtype=dtype, order='F')
+        exog[:, 0] = 1.0
+        exog[:, 1:] = x_data.to_numpy(dtype=dtype, copy=False)
+    else:
+        exog: np.ndarray = np.asfortranarray(x_data.to_numpy(dtype=dtype))
+
+    return exog
+
+
+def _fit_formula(x_data: pd.DataFrame, y_data: pd.DataFrame, include_constant: bool):
+    """
+    Create and fit the statsmodels formula model for x_data and y_data.
+
+    Parameters
+    ----------
+    x_data : pd.DataFrame -- 1 or more x variables
+    y_data : pd.DataFrame -- the y variable
+    include_constant : bool -- True if a constant should be included
+
+    Returns
+    -------
+    RegressionResultsWrapper -- statsmodels fitted model
+    """
+
+    # statsmodels and patsy are imported when first needed, so that importing
+    # r_linreg does not pay for them.
+    from patsy import PatsyError
+    from statsmodels.formula.api import ols
 
     # Concatenate x_data and y_data to create the dataframe.
     df = pd.concat([x_data, y_data], axis=1)
 
-    # Create the "formula"
-    formula = "y_data ~ " + " + ".join(x_data.columns[1:]) if include_constant else "y_data ~ " + " + ".join(x_data.columns)
+    # Create the "formula". patsy adds an intercept unless told otherwise.
+    formula = "y_data ~ " + " + ".join(x_data.columns)
+    if not include_constant:
+        formula += " - 1"
 
     try:
         # Create the statsmodels model.
@@ -351,7 +912,254 @@ def create_model(x_data: pd.DataFrame, y_data: pd.DataFrame, include_constant: b
     return model.fit()
 
 
-def multiple_regr(X: pd.DataFrame, y: pd.DataFrame, const: bool) -> OrderedDict[str, Any]:
+def _fit_ols(x_data: pd.DataFrame, y_data: pd.DataFrame, include_constant: bool):
+    """
+    Fit the statsmodels OLS model for x_data and y_data directly from the
+    design matrix. The constant column is named "Intercept", as in the
+    formula model.
+
+    Parameters
+    ----------
+    x_data : pd.DataFrame -- 1 or more x variables
+    y_data : pd.DataFrame -- the y variable
+    include_constant : bool -- True if a constant should be included
+
+    Returns
+    -------
+    RegressionResultsWrapper -- statsmodels fitted model
+    """
+
+    from statsmodels.regression.linear_model import OLS
+
+    exog: pd.DataFrame = x_data
+    if include_constant:
+        exog = x_data.copy(deep=False)
+        exog.insert(0, "Intercept", 1.0)
+
+    return OLS(y_data.iloc[:, 0], exog).fit()
+
+
+class LeastSquaresResults:
+    """
+    Results of an ordinary least squares fit, computed from the coefficients
+    returned by LAPACK. The attributes that multiple_regr() reads are the same
+    as those of statsmodels' RegressionResults. Anything else (summary(),
+    get_prediction(), ...) is passed on to the equivalent statsmodels OLS
+    model, which is only fitted the first time it is needed.
+
+    Parameters
+    ----------
+    x_data : pd.DataFrame -- 1 or more x variables, without a constant
+    y_data : pd.DataFrame -- the y variable
+    exog : np.ndarray -- design matrix, including the constant if there is one
+    endog : np.ndarray -- y values as a 1-dimension array
+    params : np.ndarray -- parameter estimates
+    rank : int -- rank of exog
+    include_constant : bool -- True if exog includes a constant
+    normalized_cov_params : np.ndarray, optional -- (X'X)^-1; computed from
+                                                    exog if not given
+    """
+
+    def __init__(self, x_data: pd.DataFrame, y_data: pd.DataFrame, exog: np.ndarray, endog: np.ndarray,
+                 params: np.ndarray, rank: int, include_constant: bool,
+                 normalized_cov_params: np.ndarray | None = None) -> None:
+        # The formula model may be fitted long after linreg() returns. Shallow
+        # copies keep it from seeing later in-place edits of the caller's data
+        # (pandas copies on write) without copying anything now.
+        self._x_data = x_data.copy(deep=False)
+        self._y_data = y_data.copy(deep=False)
+        self._include_constant = include_constant
+        self._statsmodels_results = None
+        self._formula_results = None
+
+        # Parameter names follow the formula model: "Intercept", then the x variables.
+        names: list[str] = (["Intercept"] if include_constant else []) + list(x_data.columns)
+        self._names = names
+
+        fitted: np.ndarray = exog @ params
+        resid: np.ndarray = endog - fitted
+
+        self.nobs: float = float(endog.shape[0])
+        self.k_constant: int = int(include_constant)
+        self.df_model: float = float(rank - self.k_constant)
+        self.df_resid: float = self.nobs - rank
+
+        # The arrays are wrapped, not copied (pandas copies NumPy input by default).
+        self.params: pd.Series = pd.Series(params, index=names, copy=False)
+        self.fittedvalues: pd.Series = pd.Series(fitted, index=x_data.index, copy=False)
+        self.resid: pd.Series = pd.Series(resid, index=x_data.index, copy=False)
+
+        # Sums of squares. Without a constant, R-squared and the model sum of
+        # squares are measured from zero rather than from the mean of y.
+        self.ssr: float = float(resid @ resid)
+        self.uncentered_tss: float = float(endog @ endog)
+        centered: np.ndarray = endog - endog.mean()
+        self.centered_tss: float = float(centered @ centered)
+        tss: float = self.centered_tss if include_constant else self.uncentered_tss
+        self.ess: float = tss - self.ssr
+
+        # As in statsmodels, a model with no residual (or no model) degrees of
+        # freedom gives inf or nan here rather than an error.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.mse_model: float = np.float64(self.ess) / self.df_model
+            self.mse_resid: float = np.float64(self.ssr) / self.df_resid
+            self.mse_total: float = np.float64(tss) / (self.df_resid + self.df_model)
+
+            self.rsquared: float = 1 - np.float64(self.ssr) / tss
+            self.rsquared_adj: float = 1 - np.float64(self.nobs - self.k_constant) / self.df_resid * (1 - self.rsquared)
+            self.fvalue: float = self.mse_model / self.mse_resid
+        self.f_pvalue: float = stats.f.sf(self.fvalue, self.df_model, self.df_resid)
+
+        if normalized_cov_params is None:
+            normalized_cov_params = np.linalg.pinv((exog.T @ exog).astype(np.float64, copy=False))
+        self.normalized_cov_params: np.ndarray = normalized_cov_params
+
+        self.bse: pd.Series = pd.Series(np.sqrt(np.diag(normalized_cov_params) * self.mse_resid), index=names)
+        self.tvalues: pd.Series = self.params / self.bse
+        self.pvalues: pd.Series = pd.Series(2 * stats.t.sf(np.abs(self.tvalues.to_numpy()), self.df_resid),
+                                            index=names)
+
+    def cov_params(self) -> pd.DataFrame:
+        """
+        Covariance matrix of the parameter estimates.
+        """
+        return pd.DataFrame(self.normalized_cov_params * self.mse_resid, index=self._names, columns=self._names)
+
+    @property
+    def statsmodels_results(self):
+        """
+        The equivalent statsmodels OLS model, fitted on first use from the
+        design matrix, without going through a formula.
+        """
+        if self._statsmodels_results is None:
+            self._statsmodels_results = _fit_ols(self._x_data, self._y_data, self._include_constant)
+        return self._statsmodels_results
+
+    @property
+    def formula_results(self):
+        """
+        The equivalent statsmodels formula model, fitted on first use. Only
+        anova_lm() needs this; it reads the formula's terms.
+        """
+        if self._formula_results is None:
+            self._formula_results = _fit_formula(self._x_data, self._y_data, self._include_constant)
+        return self._formula_results
+
+    def _with_constant(self, exog: Any) -> Any:
+        # New x values are given without the constant, as for a formula model.
+        if exog is None or not self._include_constant:
+            return exog
+        x_values: np.ndarray = np.asarray(exog, dtype=np.float64).reshape(-1, len(self._names) - 1)
+        return np.column_stack([np.ones(x_values.shape[0]), x_values])
+
+    def get_prediction(self, exog: Any = None, **kwargs) -> Any:
+        """
+        statsmodels' get_prediction() for new x values, one column for each x
+        variable.
+        """
+        return self.statsmodels_results.get_prediction(exog=self._with_constant(exog), **kwargs)
+
+    def predict(self, exog: Any = None, **kwargs) -> Any:
+        """
+        statsmodels' predict() for new x values, one column for each x
+        variable.
+        """
+        return self.statsmodels_results.predict(exog=self._with_constant(exog), **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set above. Private names are never
+        # delegated, so copy/pickle probes fail without fitting a model.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.statsmodels_results, name)
+
+
+class _Lazy:
+    """
+    A value in LazyStats that is computed by calling func() the first time it
+    is read.
+    """
+
+    __slots__ = ("func",)
+
+    def __init__(self, func) -> None:
+        self.func = func
+
+
+class LazyStats(dict):
+    """
+    The dictionary returned by linreg(). It behaves as a plain dict in the
+    order given by info.included_vars(), but the more expensive statistics
+    (ANOVA table, summary, correlation and covariance matrices, the sums of
+    squares and products for each x variable, and the residual and fitted
+    value DataFrames) are only computed the first time they are read, then
+    kept. Every method that returns or compares values (items(), pop(), ==,
+    copy(), dict(results), and so on) computes them first.
+    """
+
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+        if type(value) is _Lazy:
+            value = value.func()
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    # Overriding __iter__ also stops dict(results) and {**results} from copying
+    # the stored values directly; they go through keys() and __getitem__().
+    def __iter__(self):
+        return iter(self.keys())
+
+    def _materialize(self) -> None:
+        for key in self.keys():
+            self[key]
+
+    def items(self):
+        self._materialize()
+        return super().items()
+
+    def values(self):
+        self._materialize()
+        return super().values()
+
+    def copy(self) -> dict[str, Any]:
+        self._materialize()
+        return dict(super().items())
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            self[key]
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, Any]:
+        if self:
+            self[next(reversed(self.keys()))]
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return super().setdefault(key, default)
+
+    def __eq__(self, other: object) -> bool:
+        self._materialize()
+        if isinstance(other, LazyStats):
+            other._materialize()
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __repr__(self) -> str:
+        self._materialize()
+        return super().__repr__()
+
+
+def multiple_regr(X: pd.DataFrame, y: pd.DataFrame, const: bool, use_formula: bool = False,
+                  with_anova: bool = False, model_results: Any = None) -> dict[str, Any]:
     """
     Some computations are done "by hand" [e.g., x_bar is calculated as the
     X.mean()] and statsmodels is used to conduct conputations where needed.
@@ -363,34 +1171,64 @@ def multiple_regr(X: pd.DataFrame, y: pd.DataFrame, const: bool) -> OrderedDict[
     X : pd.DataFrame -- one or more independent variables
     y : pd.DataFrame -- response (dependent) variable
     const : bool -- if True, include a constant
+    use_formula : bool, optional -- default is False; if True, fit the model
+                                    with statsmodels' formula api
+    with_anova : bool, optional -- default is False; if True, compute the
+                                   ANOVA table and summary immediately
+    model_results : LeastSquaresResults, optional -- y already fitted on X;
+                                                     if None, the model is
+                                                     fitted here
 
     Returns
     -------
-    all_stats OrderedDict[str, Any] -- dictionary containing 52 statistical
-                                       parameters
+    all_stats dict[str, Any] -- dictionary containing 52 statistical
+                                parameters
     """
 
-    # Preserve the original X and y DataFrames for insertion into {all_stats}.
-    X_original: pd.DataFrame = X.copy()
-    y_original: pd.DataFrame = y.copy()
+    # Preserve the original variable names for insertion into {all_stats}.
+    x_variable_names: list[str] = list(X.columns)
+    y_variable_name: str = y.columns[0]
+
+    # NumPy views of X and y, taken once; the "by hand" statistics below are
+    # computed from these rather than from pandas columns. Xv keeps the type
+    # of X (float32 with linreg(dtype=np.float32)); sums over it are
+    # accumulated in float64.
+    Xv: np.ndarray = X.to_numpy(copy=False)
+    yv: np.ndarray = y.to_numpy(dtype=np.float64, copy=False).ravel()
 
     # Fit the model.
-    model_results = create_model(X, y, const)
+    if model_results is None:
+        model_results = create_model(X, y, const, use_formula)
+
+    # The ANOVA table needs a statsmodels formula model; the summary only needs
+    # a statsmodels model. With use_formula=True, model_results is both.
+    lsq_results: bool = isinstance(model_results, LeastSquaresResults)
 
     # Get Stepwise ANOVA table. See anova() docstring for comments on anova types.
-    anova_results = anova_lm(model_results, typ=1)
+    def anova_results() -> pd.DataFrame:
+        from statsmodels.stats.anova import anova_lm
+        return anova_lm(model_results.formula_results if lsq_results else model_results, typ=1)
 
     # statsmodels' OLS Regression Results table.
-    anova_summary = model_results.summary()
-
-    # Get the correlation matrix of X and y variables.
-    all_vars: pd.DataFrame = pd.concat([X, y], axis=1)
-    corr_matrix: pd.DataFrame = all_vars.corr()
+    def anova_summary():
+        return (model_results.statsmodels_results if lsq_results else model_results).summary()
+
+    # Get the correlation matrix of X and y variables. X and y are written into
+    # one buffer and correlated in a single call; a constant column gives NaN,
+    # as DataFrame.corr() does.
+    def corr_matrix() -> pd.DataFrame:
+        all_vars: np.ndarray = np.empty((Xv.shape[0], Xv.shape[1] + 1), dtype=np.float64)
+        all_vars[:, :-1] = Xv
+        all_vars[:, -1] = yv
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr_array: np.ndarray = np.corrcoef(all_vars, rowvar=False)
+        corr_labels: list[str] = x_variable_names + [y_variable_name]
+        return pd.DataFrame(corr_array, index=corr_labels, columns=corr_labels)
 
     # rename_columns() provides generic column headings  to make the following
     # calculations simpler.
     X = rename_columns(X, const)
-    y.columns = ["yi"]
+    y = y.set_axis(["yi"], axis=1)
 
     # Parameter estimates
     params = model_results.params.to_list()
@@ -405,16 +1243,18 @@ def multiple_regr(X: pd.DataFrame, y: pd.DataFrame, const: bool) -> OrderedDict[
     k = model_results.df_model  # degrees of freedom
 
     # DataFrame of residuals of the model.
-    residuals = model_results.resid.to_frame()
-    residuals = residuals.rename(columns={0: 'residuals'})
+    def residuals() -> pd.DataFrame:
+        return model_results.resid.to_frame(name='residuals')
 
-    # Get the Durbin-Watson statistic.
-    dw: np.float64 = durbin_watson(model_results.resid)
+    # Get the Durbin-Watson statistic: sum of squared differences of
+    # successive residuals over the sum of squared residuals.
+    resid: np.ndarray = model_results.resid.to_numpy(dtype=np.float64, copy=False)
+    resid_diff: np.ndarray = np.diff(resid)
+    dw: np.float64 = (resid_diff @ resid_diff) / (resid @ resid)
 
     # DataFrame of fitted values.
-    fitted_values = model_results.fittedvalues.to_frame()
-    fitted_values: pd.DataFrame = fitted_values.rename(
-        columns={0: 'fitted_values'})
+    def fitted_values() -> pd.DataFrame:
+        return model_results.fittedvalues.to_frame(name='fitted_values')
 
     # -- Calculate the total, model, and residual sum of squared:
     # total, or cumulative, sum of squares; sum of yi - y_bar
@@ -452,44 +1292,54 @@ def multiple_regr(X: pd.DataFrame, y: pd.DataFrame, const: bool) -> OrderedDict[
     # The two-tailed p values for the t-stats of the params.
     t_pvalues: list[float] = model_results.pvalues.to_list()
 
-    # mean of y
-    y_bar: float = y["yi"].mean()
-
-    # "SYY": "sum((yi - y_bar)^2)"
-    SYY: np.float64 = np.sum((y["yi"] - y_bar) ** 2)
-
     # "sumy": "sum(yi)"
-    sumy: np.float64 = y["yi"].sum()
+    sumy: np.float64 = yv.sum()
 
-    # "sumy2": "sum((yi)**2)"
-    sumy2: np.float64 = (y["yi"] ** 2).sum()
+    # mean of y
+    y_bar: np.float64 = sumy / n
 
-    # ----- PROCESS THE X VARIABLES INTO lists -----
+    # "SYY": "sum((yi - y_bar)^2)"; the model has already computed this as the
+    # centered total sum of squares.
+    SYY: np.float64 = model_results.centered_tss
 
-    col_names = list(X.columns)
+    # "sumy2": "sum((yi)**2)"; the model's uncentered total sum of squares.
+    sumy2: np.float64 = model_results.uncentered_tss
 
-    # mean of each column in X
-    x_bar_series = X.mean()
-    x_bar: list[float] = x_bar_series.tolist()
+    # ----- PROCESS THE X VARIABLES INTO lists -----
 
     # "sumx": "sum(xi)" for each column in X
-    sumx_series = X.sum()
-    sumx: list[float] = sumx_series.tolist()
+    sumx_v: np.ndarray = Xv.sum(axis=0, dtype=np.float64)
+    sumx: list[float] = sumx_v.tolist()
+
+    # mean of each column in X, from the sums rather than another pass over X
+    x_bar_v: np.ndarray = sumx_v / n
+    x_bar: list[float] = x_bar_v.tolist()
 
     # "sumx2": "sum((xi**2))" for each column in X
-    sumx2: list[np.float64] = [(X[col] ** 2).sum(axis=0) for col in col_names]
+    def sumx2() -> list[float]:
+        return np.einsum('ij,ij->j', Xv, Xv, dtype=np.float64).tolist()
 
     # "sumxy": "sum(xi * yi)" for each column in X.
-    sumxy: list[np.float64] = [(X[col] * y['yi']).sum() for col in col_names]
+    def sumxy() -> list[float]:
+        return (Xv.T @ yv).tolist()
+
+    # Deviations of x from the column means. SXX and SXY are summed from these,
+    # not derived as sumx2 - n * x_bar^2 and sumxy - n * x_bar * y_bar, since
+    # those differences cancel badly when the means are large relative to the
+    # spread of the data. The centered matrix is built once, for whichever of
+    # SXX and SXY is read first, and shared with the other.
+    @cache
+    def x_centered() -> np.ndarray:
+        return Xv - x_bar_v
 
-    # fmt: off
     # "SXX": "sum((xi - x_bar)^2)" for each column in X.
-    SXX: list[Any] = [(X[col] - x_bar[i]) ** 2 for i, col in enumerate(X.columns)]
-    SXX: list[np.float64] = [col_sum.sum() for col_sum in SXX]
+    def SXX() -> list[float]:
+        Xc: np.ndarray = x_centered()
+        return np.einsum('ij,ij->j', Xc, Xc).tolist()
 
     # "SXY": "sum((xi - x_bar) * (yi - y_bar))" for each column in X.
-    SXY = [((X[col] - x_bar[i]) * (y['yi'] - y_bar)).sum() for i, col in enumerate(X.columns)]
-    # fmt: on
+    def SXY() -> list[float]:
+        return (x_centered().T @ (yv - y_bar)).tolist()
 
     # standard errors of the parameter estimates.
     SE_coefficients: list[float] = model_results.bse.to_list()
@@ -498,39 +1348,47 @@ def multiple_regr(X: pd.DataFrame, y: pd.DataFrame, const: bool) -> OrderedDict[
     correlation: np.float64 = np.sqrt(r_squared)
 
     # covariance matrix
-    cov_matrix: pd.DataFrame = model_results.cov_params()
+    def cov_matrix() -> pd.DataFrame:
+        return model_results.cov_params()
+
+    # Without a constant there is no intercept: its keys are None, and the
+    # slopes start with the first parameter.
+    b: int = int(const)
 
-    all_data = {
+    # The reports() function requires that {all_stats} maintains a set order:
+    # the keys are written here in the order of info.included_vars(), which a
+    # dict preserves.
+    all_stats: dict[str, Any] = LazyStats({
         "model_results": model_results,
-        "x_variable_names": list(X_original.columns),
-        "y_variable_name": list(y_original.columns)[0],
+        "x_variable_names": x_variable_names,
+        "y_variable_name": y_variable_name,
         "n": n,
         "y": y,
         "X": X,
         "sumx": sumx,
         "sumy": sumy,
-        "sumxy": sumxy,
-        "sumx2": sumx2,
+        "sumxy": _Lazy(sumxy),
+        "sumx2": _Lazy(sumx2),
         "sumy2": sumy2,
         "x_bar": x_bar,
         "y_bar": y_bar,
-        "SXX": SXX,
+        "SXX": _Lazy(SXX),
         "SYY": SYY,
-        "SXY": SXY,
-        "anova": anova_results,
-        "anova_summary": anova_summary,
+        "SXY": _Lazy(SXY),
+        "anova": anova_results() if with_anova else _Lazy(anova_results),
+        "anova_summary": anova_summary() if with_anova else _Lazy(anova_summary),
         "coefficients": params,
-        "intercept": params[0],
-        "slope": params[1:],
+        "intercept": params[0] if const else None,
+        "slope": params[b:],
         "SE_coefficients": SE_coefficients,
-        "std_error_b0": SE_coefficients[0],
-        "std_error_b1": SE_coefficients[1:],
+        "std_error_b0": SE_coefficients[0] if const else None,
+        "std_error_b1": SE_coefficients[b:],
         "t_statistics": t_statistics,
         "t_pvalues": t_pvalues,
-        "t_intercept": t_statistics[0],
-        "t_intercept_p": t_pvalues[0],
-        "t_slope": t_statistics[1:],
-        "t_slope_p": t_pvalues[1:],
+        "t_intercept": t_statistics[0] if const else None,
+        "t_intercept_p": t_pvalues[0] if const else None,
+        "t_slope": t_statistics[b:],
+        "t_slope_p": t_pvalues[b:],
         "DFM": DFM,
         "DFR": DFR,
         "DFT": DFT,
@@ -548,35 +1406,21 @@ def multiple_regr(X: pd.DataFrame, y: pd.DataFrame, const: bool) -> OrderedDict[
         "F": F,
         "F_pvalue": F_pvalue,
         "Durbin-Watson": dw,
-        "corr_matrix": corr_matrix,
-        "cov_matrix": cov_matrix,
-        "fitted_values": fitted_values,
-        "residuals": residuals,
+        "corr_matrix": _Lazy(corr_matrix),
+        "cov_matrix": _Lazy(cov_matrix),
+        "fitted_values": _Lazy(fitted_values),
+        "residuals": _Lazy(residuals),
         "const": const,
-    }
-
-    # Create a list of keys in the order the we want items to appear when iterated.
-    vars_list: list[list[str]] = info.included_vars()
-    key_list = []
-    for i in vars_list:
-        for j in i:
-            key_list.append(j)
+    })
 
     # ! =======================================================================
-    # ! The following is for the developer only. It checks that I haven't added a key to {all_data} and forgotten to include it in the list in included_vars() or vice versa.
-    # ! for k in all_data.keys():
-    # !     if k not in key_list:
-    # !         print(f'The key "{k}" from all_data was not found in included_vars().')
-    # !         sys.exit()
-    # ! for k in key_list:
-    # !     if k not in all_data.keys():
-    # !         print(f'The key "{k}" from included_vars() was not found in all_data.')
-    # !         sys.exit()
+    # ! The following is for the developer only. It checks that I haven't added a key to {all_stats} and forgotten to include it in the list in included_vars(), or vice versa, or put a key out of order.
+    # ! key_tuple = tuple(k for group in info.included_vars() for k in group)
+    # ! if tuple(all_stats) != key_tuple:
+    # !     print(f'The keys of all_stats do not match included_vars():\n{tuple(all_stats)}\n{key_tuple}')
+    # !     sys.exit()
     # ! ======================================================================
 
-    # Create the ordered dictionary. The reports() function requires that {all_stats} maintains a set order.
-    all_stats: OrderedDict[str, Any] = OrderedDict((k, all_data[k]) for k in key_list)
-
     return all_stats
 
 
@@ -597,13 +1441,11 @@ def rename_columns(df: pd.DataFrame, has_constant: bool) -> pd.DataFrame:
     pd.DataFrame -- dataframe with renamed columns
     """
 
-    new_names = {col: col for col in df.columns}
-    if has_constant:
-        new_names.update({col: f'X{i + 1}' for i, col in enumerate(df.columns[1:])})
-    else:
-        new_names.update({col: f'X{i + 1}' for i, col in enumerate(df.columns)})
+    start: int = 1 if has_constant else 0
+    new_names: list[str] = list(df.columns[:start]) + [f'X{i + 1}' for i in range(df.shape[1] - start)]
 
-    return df.rename(columns=new_names)
+    # set_axis() returns a new DataFrame, leaving the caller's column names alone.
+    return df.set_axis(new_names, axis=1)
 
 
 if __name__ == "__main__":
@@ -10,14 +10,15 @@
 """
 
 
-from typing import OrderedDict, Any
+from typing import Any
 
 import info
+import numpy as np
 import pandas as pd
-from statsmodels.stats.descriptivestats import Description
+from scipy import stats
 
 
-def OLS_results(results: OrderedDict[str, Any]) -> None:
+def OLS_results(results: dict[str, Any]) -> None:
     """
     Print the OLS Regression Results table provided by statsmodels.
 
@@ -34,8 +35,8 @@ def OLS_results(results: OrderedDict[str, Any]) -> None:
 
     Parameters
     ----------
-    results : OrderedDict[str, Any] -- dictionary of results from running linear
-                                       regression analysis
+    results : dict[str, Any] -- dictionary of results from running linear
+                                regression analysis
     """
 
     print()
@@ -44,7 +45,7 @@ def OLS_results(results: OrderedDict[str, Any]) -> None:
     return None
 
 
-def descriptive(results: OrderedDict[str, Any], ci: int = 95) -> None:
+def descriptive(results: dict[str, Any], ci: int = 95) -> None:
     """
     This function provides a table of descriptive statistics for the regression
     data. The table includes: nobs, mean, std_err upper_ci, lower_ci, std,
@@ -52,62 +53,91 @@ def descriptive(results: OrderedDict[str, Any], ci: int = 95) -> None:
 
     Parameters
     ----------
-    results : OrderedDict[str, Any] -- results of linear regression analysis
+    results : dict[str, Any] -- results of linear regression analysis
     ci : int, optional -- confidence interval level, by default 95
 
     CODENOTE:
         https://www.statsmodels.org/stable/generated/statsmodels.stats.descriptivestats.Description.html#statsmodels.stats.descriptivestats.Description
 
-        The Description class from the statsmodels.stats.descriptivestats module
-        provides extended descriptive statistics for data in a pandas DataFrame.
-
-        Statistics: The stats parameter allows you to specify a sequence of
-        statistics to compute. If not provided, a full set of statistics is
-        computed.
-
-        Numeric and Categorical Data: It can handle both numeric and categorical
-        data, providing relevant statistics for each.
-
-        Alpha: The alpha parameter sets the significance level for confidence
-        intervals (default is 0.05 for 95% confidence intervals).
-
-        Use T-Distribution: The use_t parameter determines whether to use the
-        Student’s t-distribution to construct confidence intervals.
-
-        Percentiles: You can specify which percentiles to calculate with the
-        percentiles parameter.
-
-        Top Categories: The ntop parameter sets the number of top categorical
-        labels to report.
-
-        The selectable statistics include common measures like mean, standard
-        deviation, confidence intervals, range, maximum, minimum, median,
-        skewness, kurtosis, and more. It also includes tests for normality like
-        the Jarque-Bera test.
+        The table has the same rows, and the same values, as the numeric
+        table of statsmodels' Description class with alpha=alpha and
+        stats=['nobs', 'missing', 'mean', 'std_err', 'ci', 'std', 'coef_var',
+        'range', 'max', 'min', 'median']. Description computes its full set of
+        statistics (mode, skewness, kurtosis, the Jarque-Bera test,
+        percentiles, ...) before selecting these, so only the requested ones
+        are computed here, by _numeric_description().
     """
 
     # By way of example, a 95% CI has to be converted to an alpha of 0.05
     alpha: float = round(1 - (ci / 100), 2)
 
-    df_desc: pd.DataFrame = pd.concat(
-        [results['X'], results['y']], axis=1)
-
-    desc = Description(df_desc, alpha=alpha, stats=['nobs', 'missing', 'mean', 'std_err', 'ci', 'std', 'coef_var', 'range', 'max', 'min', 'median'])
+    # The statistics are computed for X and y separately, and only the two
+    # small tables are put side by side, so the data itself is never copied
+    # into a combined DataFrame.
+    desc_numeric: pd.DataFrame = pd.concat(
+        [_numeric_description(results['X'], alpha), _numeric_description(results['y'], alpha)], axis=1)
 
     ds: str = " DESCRIPTIVE STATISTICS ".center(34, "=")
-    print("\n", ds, "\n", desc.numeric, sep='')
+    print("\n", ds, "\n", desc_numeric, sep='')
 
     return None
 
 
-def anova(results: OrderedDict[str, Any]) -> None:
+def _numeric_description(df: pd.DataFrame, alpha: float) -> pd.DataFrame:
+    """
+    Compute the descriptive statistics printed by descriptive() for each
+    (numeric) column of df. The confidence interval for the mean uses the
+    normal distribution, as Description does by default.
+
+    Parameters
+    ----------
+    df : pd.DataFrame -- numeric data, one variable per column
+    alpha : float -- significance level of the confidence interval
+
+    Returns
+    -------
+    pd.DataFrame -- one row per statistic, one column per variable
+    """
+
+    count: pd.Series = df.count()
+    mean: pd.Series = df.mean()
+    std: pd.Series = df.std()
+    maximum: pd.Series = df.max()
+    minimum: pd.Series = df.min()
+
+    # Dividing out of place keeps a float32 std from rejecting float64 values.
+    std_err: pd.Series = std / np.sqrt(count.where(count > 0))
+    q: float = stats.norm.ppf(1.0 - alpha / 2)
+
+    # The coefficient of variation is undefined when the mean is 0.
+    nan_mean: pd.Series = mean.where(mean != 0)
+
+    rows: dict[str, pd.Series] = {
+        "nobs": pd.Series(np.full(df.shape[1], df.shape[0], dtype=np.int64), index=df.columns),
+        "missing": df.shape[0] - count,
+        "mean": mean,
+        "std_err": std_err,
+        "upper_ci": mean + q * std_err,
+        "lower_ci": mean - q * std_err,
+        "std": std,
+        "coef_var": std / nan_mean,
+        "range": maximum - minimum,
+        "max": maximum,
+        "min": minimum,
+        "median": df.median(),
+    }
+
+    return pd.DataFrame(list(rows.values()), columns=df.columns, index=list(rows))
+
+
+def anova(results: dict[str, Any]) -> None:
     """
     Print an anova table of key results of linear regression.
 
     Parameters
     ----------
-    results : OrderedDict[str, Any] -- dictionary of 52 linear regression results
-                                       from statsmodels and computations.
+    results : dict[str, Any] -- dictionary of 52 linear regression results
+                                from statsmodels and computations.
     """
 
     if results['const']:
@@ -115,22 +145,29 @@ def anova(results: OrderedDict[str, Any]) -> None:
     else:
         labels: list = results['x_variable_names']
 
-    print(f"{'PREDICTOR':^14}")
-    print(f"{'VARIABLES':^14}{'COEFFICIENT':>13}{'STD ERROR':>13}{'STUDENT\'S T':>13}{'P':>12}")
-    print("-" * 65)
+    # The table is built as a list of lines and printed with a single call.
+    lines: list[str] = [
+        f"{'PREDICTOR':^14}",
+        f"{'VARIABLES':^14}{'COEFFICIENT':>13}{'STD ERROR':>13}{'STUDENT\'S T':>13}{'P':>12}",
+        "-" * 65,
+    ]
 
     # fmt: off
-    for i, label in enumerate(labels):
-        print(f"{label[:14]:>14}{results['coefficients'][i]:>13.4f}{results['SE_coefficients'][i]:>13.4f}{results['t_statistics'][i]:>13.4f}{results['t_pvalues'][i]:>12.4f}")
-    print(
-        f"\n{'CASES INCLUDED'.ljust(20, ' ')}{results['n']:<9.0f}MISSING CASES  0")
-    print(f"DEGREES OF FREEDOM  {results['DFR']:.0f}")
-    print(
-        f"OVERALL F           {results['F']:<9.4g}P VALUE {results['F_pvalue']:.4g}")
-    print(f"ADJUSTED R SQUARED  {results['r_squared_adj']:.4g}")
-    print(f"R SQUARED           {results['r_squared']:.4f}")
-    print(f"RESID. MEAN SQUARE  {results['MSE']:.4g}")
-    print("\n")
+    lines.extend(
+        f"{label[:14]:>14}{coef:>13.4f}{se:>13.4f}{t:>13.4f}{p:>12.4f}"
+        for label, coef, se, t, p in zip(labels, results['coefficients'], results['SE_coefficients'],
+                                         results['t_statistics'], results['t_pvalues']))
+    lines.extend([
+        f"\n{'CASES INCLUDED'.ljust(20, ' ')}{results['n']:<9.0f}MISSING CASES  0",
+        f"DEGREES OF FREEDOM  {results['DFR']:.0f}",
+        f"OVERALL F           {results['F']:<9.4g}P VALUE {results['F_pvalue']:.4g}",
+        f"ADJUSTED R SQUARED  {results['r_squared_adj']:.4g}",
+        f"R SQUARED           {results['r_squared']:.4f}",
+        f"RESID. MEAN SQUARE  {results['MSE']:.4g}",
+        "\n",
+    ])
+    # fmt: on
+    print("\n".join(lines))
 
     print(
         f"STEPWISE ANALYSIS OF VARIANCE OF {results['y_variable_name']}".center(68, " "))
@@ -142,7 +179,7 @@ def anova(results: OrderedDict[str, Any]) -> None:
     return None
 
 
-def print_variables(results: OrderedDict[str, Any]=None) -> None:
+def print_variables(results: dict[str, Any]=None) -> None:
     """
     Print a list of all variables available in the results dictionary. If
     "results" is provided as an argument, then the value of each variable
@@ -152,8 +189,8 @@ def print_variables(results: OrderedDict[str, Any]=None) -> None:
 
     Parameters
     ----------
-    results : OrderedDict[str, Any], optional -- results of linear regression
-                                                 analysis, by default None
+    results : dict[str, Any], optional -- results of linear regression
+                                          analysis, by default None
     """
 
     if results:
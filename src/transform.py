@@ -3,20 +3,94 @@
       Author: Richard E. Rawson
         Date: 2024-07-16
  Description: This module contains various methods for transforming data in a
- pandas DataFrame. Each of these methods uses a deepcopy of the provided
- DataFrame. This way, the original (provided) DataFrame is not modified. It is
- still possible to modify the original DataFrame by using the returned DataFrame
- to replace the original one.
+ pandas DataFrame. Each of these methods works on a shallow copy of the
+ provided DataFrame: new or replaced columns are assigned to the copy, so the
+ original (provided) DataFrame is not modified, and the data of the columns
+ that are left alone is not duplicated. It is still possible to modify the
+ original DataFrame by using the returned DataFrame to replace the original one.
+
+ Invalid arguments raise KeyError (a column is not in the DataFrame) or
+ ValueError, so that a caller transforming many columns can catch them.
 """
 
-import sys
-from copy import deepcopy
+from typing import Any
 
+import numpy as np
 import pandas as pd
-from sklearn.preprocessing import LabelEncoder, OneHotEncoder
 
+# Number of values in the first block scanned when a column's number of unique
+# values has an upper limit; each later block is twice the size of the one
+# before. A column that already exceeds the limit within the first block is
+# rejected without hashing the rest of it.
+_UNIQUE_SAMPLE: int = 4096
 
-def interaction(df: pd.DataFrame, column1: str, column2: str) -> pd.DataFrame:
+
+def _unique_values(series: pd.Series, limit: int) -> tuple[list | None, bool]:
+    """
+    Find the unique (non-missing) values of series, stopping as soon as there
+    are more than "limit" of them. The column is scanned in blocks, so a valid
+    column is hashed once and an invalid one usually only up to its first
+    _UNIQUE_SAMPLE values.
+
+    Parameters
+    ----------
+    series : pd.Series -- the column to check
+    limit : int -- the largest number of unique values allowed
+
+    Returns
+    -------
+    tuple[list | None, bool] -- the unique values in order of appearance, or
+                                None if there are more than "limit" of them;
+                                and whether a missing value was seen
+    """
+
+    # The underlying array keeps pandas' own hashing for its dtype (strings,
+    # categoricals, ...), rather than converting to an object ndarray.
+    values = series.array
+    seen: dict[Any, None] = {}
+    has_missing: bool = False
+
+    start: int = 0
+    size: int = _UNIQUE_SAMPLE
+    while start < len(values):
+        block = pd.unique(values[start:start + size])
+        missing: np.ndarray = pd.isna(block)
+        if missing.any():
+            has_missing = True
+            block = block[~missing]
+        if block.size > limit:
+            return None, has_missing
+        seen.update(dict.fromkeys(block))
+        if len(seen) > limit:
+            return None, has_missing
+        start += size
+        size *= 2
+
+    return list(seen), has_missing
+
+
+def _validate(df: pd.DataFrame, *columns: str) -> None:
+    """
+    Check that every one of "columns" is a column of df.
+
+    Parameters
+    ----------
+    df : pd.DataFrame -- the DataFrame to be transformed
+    columns : str -- the column names used by the transformation
+
+    Raises
+    ------
+    KeyError -- if any of the columns is not in df
+    """
+
+    missing: list[str] = [column for column in columns if column not in df.columns]
+    if missing:
+        raise KeyError(f"Column(s) not found in DataFrame: {', '.join(map(str, missing))}")
+
+    return None
+
+
+def interaction(df: pd.DataFrame, column1: str, column2: str, dtype: Any = None) -> pd.DataFrame:
     """
     This is a function that takes two df column names and creates a third column
     that is the interaction between the two.     The new column is named
@@ -27,25 +101,95 @@ def interaction(df: pd.DataFrame, column1: str, column2: str) -> pd.DataFrame:
         df (pd.DataFrame): The DataFrame containing the columns.
         column1 (str): The name of the first column.
         column2 (str): The name of the second column.
+        dtype (optional): NumPy dtype of the new column, e.g. np.float32 to
+            halve its memory for use with linreg(..., dtype=np.float32). By
+            default, the product keeps the dtype pandas gives it.
 
     Returns:
     ----------
         pd.DataFrame: The DataFrame with the new column added.
+
+    Raises:
+    ----------
+        KeyError: If either column is not in the DataFrame.
     """
 
-    df_314066: pd.DataFrame = deepcopy(df)
+    _validate(df, column1, column2)
 
-    if column1 not in df_314066.columns or column2 not in df_314066.columns:
-        print("One or both columns are not in the DataFrame")
-        sys.exit()
+    df_314066: pd.DataFrame = df.copy(deep=False)
 
     new_column_name: str = f"{column1}*{column2}"
-    df_314066[new_column_name] = df_314066[column1] * df_314066[column2]
+    if dtype is None:
+        df_314066[new_column_name] = df_314066[column1] * df_314066[column2]
+    else:
+        df_314066[new_column_name] = np.multiply(df_314066[column1].to_numpy(dtype=dtype),
+                                                 df_314066[column2].to_numpy(dtype=dtype))
 
     return df_314066
 
 
-def poly(df: pd.DataFrame, column: str, order: int) -> pd.DataFrame:
+def interactions_all(df: pd.DataFrame, columns: list[str], dtype: Any = None) -> pd.DataFrame:
+    """
+    Create the interaction of every pair of the given columns in one call. For
+    columns [a, b, c], the new columns are "a*b", "a*c", and "b*c", named and
+    computed as interaction() would, in that order. A new column replaces any
+    existing column of the same name in place, as interaction() does.
+
+    Parameters
+    ----------
+    df : pd.DataFrame -- any DataFrame (with numeric columns)
+    columns : list[str] -- two or more column names
+    dtype : optional -- NumPy dtype of the new columns, as for interaction();
+                        by default, each product keeps the dtype pandas gives
+                        it
+
+    Returns
+    -------
+    DataFrame -- original DataFrame with one additional column for each pair of
+    columns
+
+    Raises
+    ------
+    ValueError -- if fewer than two columns are given, or columns is a string
+    KeyError -- if any of the columns is not in the DataFrame
+    """
+
+    if isinstance(columns, str):
+        raise ValueError("columns must be a list of column names, not a string.")
+    if len(columns) < 2:
+        raise ValueError("At least two columns are needed for interactions.")
+
+    _validate(df, *columns)
+
+    names: list[str] = [f"{columns[i]}*{columns[j]}"
+                        for i in range(len(columns)) for j in range(i + 1, len(columns))]
+
+    if dtype is None:
+        # Each pair is multiplied in its own column dtypes, as in interaction(),
+        # so that (for example) int * int stays an integer column.
+        products: pd.DataFrame = pd.concat(
+            [df[columns[i]] * df[columns[j]]
+             for i in range(len(columns)) for j in range(i + 1, len(columns))],
+            axis=1, keys=names)
+    else:
+        # All products are written into one preallocated block.
+        values: np.ndarray = df[list(columns)].to_numpy(dtype=dtype)
+        products = np.empty((values.shape[0], len(names)), dtype=values.dtype, order='F')
+        n: int = 0
+        for i in range(len(columns)):
+            for j in range(i + 1, len(columns)):
+                np.multiply(values[:, i], values[:, j], out=products[:, n])
+                n += 1
+
+    # As in interaction(), an existing column of the same name is replaced
+    # where it is; the other new columns are added at the end.
+    df_314066: pd.DataFrame = df.copy(deep=False)
+    df_314066[names] = products
+
+    return df_314066
+
+
+def poly(df: pd.DataFrame, column: str, order: int, dtype: Any = None) -> pd.DataFrame:
     """
     Compute a polynomial of a specified order for a specific column in the
     DataFrame. The new column is named as the original column name followed by
@@ -56,36 +200,45 @@ def poly(df: pd.DataFrame, column: str, order: int) -> pd.DataFrame:
     df : pd.DataFrame -- any DataFrame (with numeric columns)
     column : str -- column name to use for computing the polynomial
     order : int -- order of the resulting polynomial
+    dtype : optional -- NumPy dtype of the new column, e.g. np.float32 to halve
+                        its memory for use with linreg(..., dtype=np.float32);
+                        float32 keeps about 7 significant digits, which high
+                        powers of large values can exceed. By default, the
+                        power keeps the dtype pandas gives it.
 
     Returns
     -------
     DataFrame -- original DataFrame with one additional column containing the
     polynomial of the specified order
-    """
 
-    df_314066: pd.DataFrame = deepcopy(df)
+    Raises
+    ------
+    ValueError -- if order is not an integer of at least 2
+    KeyError -- if column is not in the DataFrame
+    """
 
     if order < 2:
-        print('Order of a polynomial must be at least 2.')
-        sys.exit()
+        raise ValueError("Order of a polynomial must be at least 2.")
     if round(order, 0) != order:
-        print("Order must be an integer.")
-        sys.exit()
+        raise ValueError("Order must be an integer.")
+
+    _validate(df, column)
 
-    if column not in df_314066.columns:
-        print(f"Column {column} not found in DataFrame")
-        sys.exit()
+    df_314066: pd.DataFrame = df.copy(deep=False)
 
     new_column_name: str = f'{column}{order}'
-    df_314066[new_column_name] = df_314066[column] ** order
+    if dtype is None:
+        df_314066[new_column_name] = df_314066[column] ** order
+    else:
+        df_314066[new_column_name] = df_314066[column].to_numpy(dtype=dtype) ** int(order)
 
     return df_314066
 
 
 def encode(df: pd.DataFrame, column: str) -> pd.DataFrame:
     """
-    Encode a binary column with 0 and 1. Replace the original column with the
-    encoded column.
+    Encode a binary column with 0 and 1 (as uint8), in the sorted order of its
+    two values. Replace the original column with the encoded column.
 
     Parameters:
     ----------
@@ -95,18 +248,31 @@ def encode(df: pd.DataFrame, column: str) -> pd.DataFrame:
     Returns:
     -------
     pd.DataFrame: DataFrame with the encoded column replacing the original column.
+
+    Raises:
+    -------
+    KeyError: If the column is not in the DataFrame.
+    ValueError: If the column does not have exactly two unique values, or has
+    missing values.
     """
-    df_314066: pd.DataFrame = deepcopy(df)
-    if df_314066[column].nunique() != 2:
-        print("Column must have exactly two unique values.")
-        sys.exit()
 
-    if column not in df_314066.columns:
-        print("Column name not found in DataFrame.")
-        sys.exit()
+    _validate(df, column)
+
+    unique_values, has_missing = _unique_values(df[column], 2)
+    if unique_values is None or len(unique_values) != 2:
+        raise ValueError("Column must have exactly two unique values.")
+    if has_missing:
+        raise ValueError("Column must not contain missing values.")
 
-    label_encoder = LabelEncoder()
-    df_314066[column] = label_encoder.fit_transform(df_314066[column])
+    df_314066: pd.DataFrame = df.copy(deep=False)
+
+    # The smaller of the two values is coded 0 and the larger one 1. Values
+    # that cannot be ordered keep their order of appearance.
+    try:
+        unique_values = sorted(unique_values)
+    except TypeError:
+        pass
+    df_314066[column] = (df_314066[column] == unique_values[1]).to_numpy(dtype=np.uint8)
 
     return df_314066
 
@@ -119,8 +285,12 @@ def dummy(df: pd.DataFrame, column: str) -> pd.DataFrame:
     values. The original column will be retained.
 
     This function has limited options for encoding categorical data, but chooses
-    to encode using the most commonly used options. For details, see
-    https://scikit-learn.org/stable/modules/generated/sklearn.preprocessing.OneHotEncoder.html.
+    to encode using the most commonly used options. Each new column is named
+    "{column}_{value}" and holds 1 where "column" equals that value and 0
+    elsewhere, stored as uint8; if "column" has missing values, they are
+    marked in a last column, "{column}_nan". A column of that name that already
+    exists is replaced in place. For details, see
+    https://pandas.pydata.org/docs/reference/api/pandas.get_dummies.html.
 
     The "drop" option is not used, meaning that all features will be retained,
     even if they are not needed for the model. If a column has 4 features (e.g.,
@@ -136,21 +306,27 @@ def dummy(df: pd.DataFrame, column: str) -> pd.DataFrame:
     Returns
     -------
     DataFrame -- the original DataFrame with the encoded columns
+
+    Raises
+    ------
+    KeyError -- if column is not in the DataFrame
+    ValueError -- if column has more than 4 unique values
     """
 
-    if column not in df.columns:
-        print("Error: Column name not found in DataFrame.")
-        sys.exit()
+    _validate(df, column)
 
-    if df[column].nunique() > 4:
-        print("Encoding a column with more than 4 unique values is not supported.")
-        sys.exit()
+    unique_values, has_missing = _unique_values(df[column], 4)
+    if unique_values is None:
+        raise ValueError("Encoding a column with more than 4 unique values is not supported.")
 
-    encoder = OneHotEncoder(sparse_output=False)
-    encoded_column = encoder.fit_transform(df[[column]])
-    encoded_columns = encoder.get_feature_names_out([column])
-    encoded_column_df = pd.DataFrame(data=encoded_column, columns=encoded_columns)
-    df_314066: pd.DataFrame = pd.concat([df, encoded_column_df], axis=1)
+    # The dummy columns share the index of df, whatever it is. Assigning them
+    # by name replaces dummy columns that already exist (e.g., from an earlier
+    # call) where they are, and adds the others at the end. Missing values
+    # get their own "{column}_nan" column, last, only if there are any.
+    encoded_column_df: pd.DataFrame = pd.get_dummies(df[column], prefix=column, dummy_na=has_missing,
+                                                     dtype=np.uint8)
+    df_314066: pd.DataFrame = df.copy(deep=False)
+    df_314066[list(encoded_column_df.columns)] = encoded_column_df
 
     return df_314066
 